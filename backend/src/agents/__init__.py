@@ -1,6 +1,11 @@
 """Agents module for AI Meeting Intelligence System."""
 
-from .graph import MeetingAnalyzer, create_analysis_graph
+from .graph import (
+    MeetingAnalyzer,
+    create_analysis_graph,
+    create_initial_state,
+    get_meeting_analyzer,
+)
 from .qa_agent import QAAgent, get_qa_agent
 from .state import AgentState
 
@@ -9,5 +14,7 @@ __all__ = [
     "MeetingAnalyzer",
     "QAAgent",
     "create_analysis_graph",
+    "create_initial_state",
+    "get_meeting_analyzer",
     "get_qa_agent",
 ]
@@ -0,0 +1,214 @@
+"""
+Analysis Cache - Skip Repeated LLM Extraction
+
+Re-analyzing the same meeting (retries, re-runs, dev loops) used to
+re-issue the decisions/actions LLM calls every time. This module keeps
+successful extraction results in-process, keyed by a hash of the exact
+prompt inputs, so a repeat returns instantly with no LLM cost.
+
+Only results without an error are stored, so a failed run is retried
+for real on the next request.
+
+An optional SemanticCache extends this to NEAR-duplicate transcripts
+(recurring standups, re-uploaded drafts) by comparing embeddings.
+
+The same AnalysisCache class also backs the Q&A retrieval and answer
+caches, so a repeated question skips the embedding call and vector
+search, and usually the answer LLM call as well.
+"""
+
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a stable cache key from the prompt inputs.
+    
+    Args:
+        *parts: Strings that fully determine the LLM prompt
+    
+    Returns:
+        Hex SHA-256 digest of the parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")  # Separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Small in-process LRU cache with a time-to-live.
+    
+    ATTRIBUTES:
+    -----------
+        max_entries: Maximum number of cached results (oldest evicted first)
+        ttl_seconds: How long a cached result stays valid
+        stats: {"hits": int, "misses": int} for monitoring hit rate
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
+class SemanticCache:
+    """
+    In-process cache keyed by embedding similarity instead of exact match.
+    
+    A lookup returns the cached value of the most similar stored embedding
+    if its cosine similarity is at least `threshold`. Vectors are stored
+    normalized so similarity is a plain dot product.
+    
+    ATTRIBUTES:
+    -----------
+        threshold: Minimum cosine similarity for a hit (e.g. 0.92)
+        max_entries: Maximum number of cached results (oldest evicted first)
+        ttl_seconds: How long a cached result stays valid
+        stats: {"hits": int, "misses": int} for monitoring hit rate
+    """
+    
+    def __init__(self, threshold: float, max_entries: int, ttl_seconds: float) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: list[tuple[float, list[float], Any]] = []
+    
+    def get(self, embedding: list[float]) -> Optional[Any]:
+        """Return the value cached for the most similar embedding, or None."""
+        now = time.monotonic()
+        self._entries = [entry for entry in self._entries if entry[0] >= now]
+        
+        query = self._normalize(embedding)
+        best_score, best_value = -1.0, None
+        for _, vector, value in self._entries:
+            score = sum(a * b for a, b in zip(query, vector))
+            if score > best_score:
+                best_score, best_value = score, value
+        
+        if best_score >= self.threshold:
+            self.stats["hits"] += 1
+            return best_value
+        
+        self.stats["misses"] += 1
+        return None
+    
+    def set(self, embedding: list[float], value: Any) -> None:
+        """Store value under embedding, evicting the oldest entry if full."""
+        expires = time.monotonic() + self.ttl_seconds
+        self._entries.append((expires, self._normalize(embedding), value))
+        
+        if len(self._entries) > self.max_entries:
+            del self._entries[: len(self._entries) - self.max_entries]
+    
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+    
+    @staticmethod
+    def _normalize(vector: list[float]) -> list[float]:
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+
+@lru_cache()
+def get_analysis_cache() -> AnalysisCache:
+    """
+    Get the extraction result cache (singleton).
+    
+    Returns:
+        AnalysisCache: Shared cache sized from settings
+    """
+    settings = get_settings()
+    return AnalysisCache(
+        max_entries=settings.analysis_cache_max_entries,
+        ttl_seconds=settings.analysis_cache_ttl_seconds,
+    )
+
+
+@lru_cache()
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get the near-duplicate extraction cache (singleton).
+    
+    Returns:
+        SemanticCache, or None when disabled in settings
+    """
+    settings = get_settings()
+    if not settings.semantic_cache_enabled:
+        return None
+    return SemanticCache(
+        threshold=settings.semantic_cache_threshold,
+        max_entries=settings.analysis_cache_max_entries,
+        ttl_seconds=settings.semantic_cache_ttl_seconds,
+    )
+
+
+@lru_cache()
+def get_retrieval_cache() -> AnalysisCache:
+    """
+    Get the Q&A retrieval cache (singleton).
+    
+    Returns:
+        AnalysisCache: Shared cache sized from settings
+    """
+    settings = get_settings()
+    return AnalysisCache(
+        max_entries=settings.retrieval_cache_max_entries,
+        ttl_seconds=settings.retrieval_cache_ttl_seconds,
+    )
+
+
+@lru_cache()
+def get_answer_cache() -> AnalysisCache:
+    """
+    Get the Q&A answer cache (singleton).
+    
+    Returns:
+        AnalysisCache: Shared cache sized from settings
+    """
+    settings = get_settings()
+    return AnalysisCache(
+        max_entries=settings.answer_cache_max_entries,
+        ttl_seconds=settings.answer_cache_ttl_seconds,
+    )
@@ -8,7 +8,7 @@ pipeline that processes meeting transcripts through multiple AI-powered nodes.
 ARCHITECTURE OVERVIEW:
 =============================================================================
 
-The graph follows a LINEAR pipeline pattern:
+The graph parses first, then FANS OUT to two independent branches:
 
     START
       │
@@ -18,26 +18,17 @@ The graph follows a LINEAR pipeline pattern:
   │  Node   │    Output: parsed_transcript, participants
   └────┬────┘
        │
-       ▼
-  ┌─────────────┐    Generates high-level meeting overview
-  │ Summarizer  │    Input: parsed_transcript
-  │    Node     │    Output: summary, key_topics  
-  └──────┬──────┘
-         │
-         ▼
-  ┌─────────────┐    Extracts decisions, agreements, pivots
-  │  Decisions  │    Input: parsed_transcript
-  │    Node     │    Output: decisions[]
-  └──────┬──────┘
-         │
-         ▼
-  ┌─────────────┐    Identifies action items with owners/deadlines
-  │  Actions    │    Input: parsed_transcript
-  │    Node     │    Output: action_items[]
-  └──────┬──────┘
-         │
-         ▼
-       END
+       ├──────────────────────────┐
+       ▼                          ▼
+  ┌─────────────┐          ┌─────────────┐
+  │ Summarizer  │          │  Extract    │  Runs Decisions + Actions
+  │    Node     │          │    Node     │  concurrently (asyncio.gather)
+  └──────┬──────┘          └──────┬──────┘
+   summary, key_topics     decisions[], action_items[]
+         │                        │
+         └───────────┬────────────┘
+                     ▼
+                    END
 
 =============================================================================
 KEY CONCEPTS:
@@ -51,6 +42,9 @@ KEY CONCEPTS:
 2. ASYNC EXECUTION:
    - All nodes are async for better performance
    - Use `await` when calling the graph
+   - The Summarizer and Extract branches run in the same graph step,
+     and the Extract node awaits the Decisions and Actions LLM calls
+     together, so all three round-trips overlap instead of adding up
 
 3. NODE FUNCTIONS:
    - Receive `AgentState` as input
@@ -78,13 +72,13 @@ USAGE EXAMPLE:
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from langgraph.graph import StateGraph, END
 
 from .nodes import (
-    actions_node,
-    decisions_node,
+    extract_node,
     parser_node,
     summarizer_node,
 )
@@ -102,19 +96,29 @@ def create_analysis_graph() -> StateGraph:
     
     GRAPH STRUCTURE:
     ----------------
-    The graph is a linear pipeline where each node processes the
-    transcript in sequence:
+    The parser runs first; the two LLM branches then run in parallel:
     
     1. parser_node     → Normalizes format, extracts speakers
     2. summarizer_node → Generates meeting summary via LLM
-    3. decisions_node  → Extracts decisions via LLM (JSON output)
-    4. actions_node    → Extracts action items via LLM (JSON output)
+       extract_node    → Runs decisions_node and actions_node concurrently
+                         (both extract JSON output via LLM)
     
-    WHY LINEAR (not parallel)?
-    --------------------------
-    - Summarizer needs parsed transcript for better quality
-    - Decisions/Actions could run in parallel, but sequential is simpler
-    - LLM rate limits favor sequential execution anyway
+    WHY FAN OUT AFTER THE PARSER?
+    -----------------------------
+    - Neither branch reads the other's output: the extractors only use
+      the parser's prompt inputs, never the summary
+    - Running them sequentially made an analysis cost
+      summary + max(decisions, actions); in parallel it's the max of all three
+    - They write disjoint state fields, and the shared `error` field has
+      a reducer, so both updates merge cleanly at the join
+    
+    WHY A FUSED EXTRACT NODE?
+    -------------------------
+    - Decisions and Actions only read parsed_transcript/participants
+    - Both are I/O-bound LLM calls: gathering them makes the extraction
+      phase cost max(a, b) instead of a + b
+    - A failure in one branch is isolated and doesn't drop the other's
+      results; error messages from both are merged (see state.py)
     
     Returns:
         StateGraph: Compiled LangGraph that can be invoked with state
@@ -136,8 +140,7 @@ def create_analysis_graph() -> StateGraph:
     # IMPORTANT: Node names are used for routing (see edges below)
     workflow.add_node("parser", parser_node)
     workflow.add_node("summarizer", summarizer_node)  
-    workflow.add_node("decisions", decisions_node)
-    workflow.add_node("actions", actions_node)
+    workflow.add_node("extract", extract_node)
     
     # ---------------------------------------------------------------------------
     # STEP 3: Define the edges (execution order)
@@ -145,14 +148,17 @@ def create_analysis_graph() -> StateGraph:
     # set_entry_point: Where execution starts
     workflow.set_entry_point("parser")
     
-    # add_edge: Connect nodes in sequence
+    # add_edge: Connect nodes
     # Format: add_edge(from_node, to_node)
+    # Two edges out of "parser" make LangGraph run both targets in the
+    # same step (concurrently, since they are async)
     workflow.add_edge("parser", "summarizer")
-    workflow.add_edge("summarizer", "decisions")
-    workflow.add_edge("decisions", "actions")
+    workflow.add_edge("parser", "extract")
     
     # END: Special constant that marks the end of the graph
-    workflow.add_edge("actions", END)
+    # The run finishes once both branches have completed
+    workflow.add_edge("summarizer", END)
+    workflow.add_edge("extract", END)
     
     # ---------------------------------------------------------------------------
     # STEP 4: Compile the graph
@@ -162,6 +168,56 @@ def create_analysis_graph() -> StateGraph:
     return workflow.compile()
 
 
+@lru_cache(maxsize=1)
+def _compiled_graph() -> StateGraph:
+    """
+    Get the compiled analysis graph (built once per process).
+    
+    A compiled graph holds no per-run state, so one instance can be
+    shared by every MeetingAnalyzer instead of recompiling each time.
+    """
+    return create_analysis_graph()
+
+
+def create_initial_state(
+    meeting_id: str,
+    meeting_title: str,
+    raw_transcript: str,
+    force: bool = False,
+) -> AgentState:
+    """
+    Create the initial graph state for one meeting.
+    
+    This is the input to the first node (parser).
+    Only the required fields are set; others will be populated by nodes.
+    
+    Args:
+        meeting_id: Unique identifier for the meeting
+        meeting_title: Human-readable meeting title
+        raw_transcript: The full transcript text to analyze
+        force: Skip the LLM result caches (see AgentState.force)
+    
+    Returns:
+        AgentState ready for graph.ainvoke()
+    """
+    return {
+        "meeting_id": meeting_id,
+        "meeting_title": meeting_title,
+        "raw_transcript": raw_transcript,
+        "force": force,
+        # These will be populated by the pipeline nodes:
+        "parsed_transcript": None,
+        "participants": [],
+        "prompt_transcript": None,
+        "participants_str": None,
+        "summary": None,
+        "key_topics": [],
+        "decisions": [],
+        "action_items": [],
+        "error": None,
+    }
+
+
 class MeetingAnalyzer:
     """
     High-level interface for analyzing meeting transcripts.
@@ -181,7 +237,7 @@ class MeetingAnalyzer:
     ATTRIBUTES:
     -----------
         graph: The compiled LangGraph workflow
-        
+    
     METHODS:
     --------
         analyze(): Run full analysis on a transcript
@@ -191,17 +247,19 @@ class MeetingAnalyzer:
         """
         Initialize the analyzer with a compiled graph.
         
-        The graph is created once and reused for all analysis calls.
-        This is efficient because graph compilation is relatively expensive.
+        The graph is compiled once per process and shared by all analyzer
+        instances. This is efficient because graph compilation is relatively
+        expensive.
         """
         logger.info("Initializing MeetingAnalyzer with LangGraph pipeline")
-        self.graph = create_analysis_graph()
+        self.graph = _compiled_graph()
     
     async def analyze(
         self,
         meeting_id: str,
         meeting_title: str,
         raw_transcript: str,
+        force: bool = False,
     ) -> AgentState:
         """
         Analyze a meeting transcript through the full pipeline.
@@ -216,6 +274,7 @@ class MeetingAnalyzer:
             meeting_title: Human-readable meeting title (used in LLM prompts)
             raw_transcript: The full transcript text to analyze
                            Format: "[timestamp] Speaker: Text" per line
+            force: Re-run the LLM calls instead of returning cached results
         
         Returns:
             AgentState: Final state containing:
@@ -239,30 +298,13 @@ class MeetingAnalyzer:
         """
         logger.info(f"Starting analysis for meeting: {meeting_id}")
         
-        # ---------------------------------------------------------------------------
-        # Create initial state
-        # ---------------------------------------------------------------------------
-        # This is the input to the first node (parser)
-        # Only the required fields are set; others will be populated by nodes
-        initial_state: AgentState = {
-            "meeting_id": meeting_id,
-            "meeting_title": meeting_title,
-            "raw_transcript": raw_transcript,
-            # These will be populated by the pipeline nodes:
-            "parsed_transcript": None,
-            "participants": [],
-            "summary": None,
-            "key_topics": [],
-            "decisions": [],
-            "action_items": [],
-            "error": None,
-        }
+        initial_state = create_initial_state(meeting_id, meeting_title, raw_transcript, force)
         
         # ---------------------------------------------------------------------------
         # Run the graph
         # ---------------------------------------------------------------------------
         # ainvoke() runs the graph asynchronously
-        # The state flows through: parser → summarizer → decisions → actions
+        # The state flows through: parser → (summarizer | extract)
         final_state = await self.graph.ainvoke(initial_state)
         
         logger.info(
@@ -272,3 +314,17 @@ class MeetingAnalyzer:
         )
         
         return final_state
+
+
+@lru_cache()
+def get_meeting_analyzer() -> MeetingAnalyzer:
+    """
+    Get the MeetingAnalyzer instance (singleton).
+    
+    The analyzer holds no per-request state, so one instance is shared
+    by all requests.
+    
+    Returns:
+        MeetingAnalyzer: Shared analyzer instance
+    """
+    return MeetingAnalyzer()
@@ -1,13 +1,31 @@
-"""Agent nodes for meeting analysis."""
+"""
+Agent nodes for meeting analysis.
+
+Every LLM prompt in these nodes is ordered static-first, dynamic-last: the
+system prompt and the fixed lead-in of the user prompt never change, so
+the provider's prompt cache can reuse that prefix. Keep per-meeting values
+(title, participants, transcript) after the lead-in when editing prompts.
+"""
 
 from .actions import actions_node
 from .decisions import decisions_node
-from .parser import parse_transcript, parser_node
+from .extract import extract_node
+from .parser import (
+    build_prompt_inputs,
+    format_parsed_transcript,
+    iter_transcript,
+    parse_transcript,
+    parser_node,
+)
 from .summarizer import summarizer_node
 
 __all__ = [
     "actions_node",
+    "build_prompt_inputs",
     "decisions_node",
+    "extract_node",
+    "format_parsed_transcript",
+    "iter_transcript",
     "parse_transcript",
     "parser_node",
     "summarizer_node",
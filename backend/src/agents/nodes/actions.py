@@ -5,17 +5,21 @@ This node identifies action items, tasks, and assignments
 from the meeting transcript with owners and deadlines.
 """
 
-import json
 import logging
+from contextlib import aclosing
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
 from ...models import ActionItem
-from ...services import get_llm_service
+from ...services import LLMService, get_llm_service
+from ...utils import JsonArrayStreamParser, validate_items
 from ..state import AgentState
 
 logger = logging.getLogger(__name__)
 
+# Matches the limit stated in the system prompt
+MAX_ACTION_ITEMS = 15
+
 ACTION_ITEM_SYSTEM_PROMPT = """You are an expert at analyzing meeting transcripts to identify 
 action items, tasks, and assignments.
 
@@ -32,26 +36,34 @@ For each action item, identify:
 - Priority (high/medium/low based on urgency/importance)
 - Context from the discussion
 
-Output your findings as a JSON array with this structure:
-[
-    {
-        "task": "Description of the task",
-        "owner": "Person responsible or null",
-        "deadline": "Deadline if mentioned or null",
-        "priority": "high/medium/low or null",
-        "context": "Brief context from discussion"
-    }
-]
+Output your findings as a JSON object with this structure:
+{
+    "action_items": [
+        {
+            "task": "Description of the task",
+            "owner": "Person responsible or null",
+            "deadline": "Deadline if mentioned or null",
+            "priority": "high/medium/low or null",
+            "context": "Brief context from discussion"
+        }
+    ]
+}
 
 Guidelines:
 - Be specific about what needs to be done
 - Use exact participant names as owners
 - Only include items that are clearly tasks, not suggestions
 - Infer priority from language (ASAP = high, "when you can" = low)
-- If no clear action items, return an empty array []
+- If no clear action items, return {"action_items": []}
 - Maximum 15 action items per meeting"""
 
-ACTION_ITEM_USER_PROMPT = """Analyze the following meeting transcript and extract all action items:
+# Built once and reused; the system message is the same for every call
+_ACTION_ITEM_SYSTEM_MESSAGE = SystemMessage(content=ACTION_ITEM_SYSTEM_PROMPT)
+
+
+def _render_action_item_prompt(title: str, participants: str, transcript: str) -> str:
+    """Render the action item user prompt."""
+    return f"""Analyze the following meeting transcript and extract all action items:
 
 Meeting Title: {title}
 Participants: {participants}
@@ -60,7 +72,7 @@ Participants: {participants}
 {transcript}
 --- END TRANSCRIPT ---
 
-Extract the action items as a JSON array."""
+Extract the action items as a JSON object."""
 
 
 async def actions_node(state: AgentState) -> dict:
@@ -83,27 +95,20 @@ async def actions_node(state: AgentState) -> dict:
     try:
         llm_service = get_llm_service()
         
-        # Use parsed transcript if available
-        transcript = state.get("parsed_transcript") or state["raw_transcript"]
-        participants = ", ".join(state.get("participants", [])) or "Not specified"
-        
         # Create the prompt
-        user_message = ACTION_ITEM_USER_PROMPT.format(
+        user_message = _render_action_item_prompt(
             title=state["meeting_title"],
-            participants=participants,
-            transcript=transcript[:15000],
+            participants=state["participants_str"],
+            transcript=state["prompt_transcript"],  # Pre-sliced by the parser
         )
         
         messages = [
-            SystemMessage(content=ACTION_ITEM_SYSTEM_PROMPT),
+            _ACTION_ITEM_SYSTEM_MESSAGE,
             HumanMessage(content=user_message),
         ]
         
-        # Generate action item extraction
-        response = await llm_service.chat(messages)
-        
-        # Parse the JSON response
-        action_items = _parse_action_items(response)
+        # Generate action item extraction, parsing items as they stream in
+        action_items = await _stream_action_items(llm_service, messages)
         
         logger.info(f"Extracted {len(action_items)} action items")
         
@@ -119,58 +124,32 @@ async def actions_node(state: AgentState) -> dict:
         }
 
 
-def _parse_action_items(response: str) -> list[ActionItem]:
-    """
-    Parse the LLM response into ActionItem objects.
-    
-    Args:
-        response: LLM response containing JSON
-    
-    Returns:
-        List of ActionItem objects
+async def _stream_action_items(
+    llm_service: LLMService,
+    messages: list[BaseMessage],
+) -> list[ActionItem]:
     """
-    action_items = []
-    
-    try:
-        # Find JSON array in response
-        json_str = _extract_json_array(response)
-        
-        if json_str:
-            data = json.loads(json_str)
-            
-            for item in data:
-                if isinstance(item, dict) and "task" in item:
-                    action_items.append(
-                        ActionItem(
-                            task=item.get("task", ""),
-                            owner=item.get("owner"),
-                            deadline=item.get("deadline"),
-                            priority=item.get("priority"),
-                            context=item.get("context"),
-                        )
-                    )
-    except json.JSONDecodeError as e:
-        logger.warning(f"Failed to parse action items JSON: {e}")
-    except Exception as e:
-        logger.error(f"Error parsing action items: {e}")
+    Stream the LLM response and parse ActionItem objects as they complete.
     
-    return action_items
-
-
-def _extract_json_array(text: str) -> str | None:
-    """
-    Extract JSON array from text that may contain other content.
+    Items are picked out of the "action_items" array while the LLM is still
+    generating. Once the array closes or MAX_ACTION_ITEMS items have arrived,
+    the stream is closed so the rest of the decode is never paid for.
     
     Args:
-        text: Text containing JSON array
+        llm_service: LLM service to stream from
+        messages: Prompt messages
     
     Returns:
-        The JSON array string, or None if not found
+        List of ActionItem objects
     """
-    start = text.find("[")
-    end = text.rfind("]")
+    parser = JsonArrayStreamParser()
+    items: list[dict] = []
     
-    if start != -1 and end != -1 and end > start:
-        return text[start:end + 1]
+    # JSON mode guarantees syntactically valid JSON with no prose around it
+    async with aclosing(llm_service.chat_stream(messages, json_mode=True)) as stream:
+        async for chunk in stream:
+            items.extend(item for item in parser.feed(chunk) if "task" in item)
+            if parser.done or len(items) >= MAX_ACTION_ITEMS:
+                break
     
-    return None
+    return validate_items(ActionItem, items[:MAX_ACTION_ITEMS])
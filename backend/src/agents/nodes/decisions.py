@@ -5,18 +5,22 @@ This node identifies and extracts key decisions, agreements,
 and pivotal moments from the meeting transcript.
 """
 
-import json
 import logging
+from contextlib import aclosing
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
 from ...models import Decision
-from ...services import get_llm_service
+from ...services import LLMService, get_llm_service
+from ...utils import JsonArrayStreamParser, validate_items
 from ..state import AgentState
 
 logger = logging.getLogger(__name__)
 
+# Matches the limit stated in the system prompt
+MAX_DECISIONS = 10
+
 DECISION_EXTRACTOR_SYSTEM_PROMPT = """You are an expert at analyzing meeting transcripts to identify 
 key decisions and agreements made during discussions.
 
@@ -32,23 +36,30 @@ For each decision, identify:
 - The context or reasoning behind it
 - Related discussion points
 
-Output your findings as a JSON array with this structure:
-[
-    {
-        "decision": "Description of the decision",
-        "made_by": "Person who made/announced it or null",
-        "context": "Brief context or reasoning",
-        "related_discussion": "Related discussion points"
-    }
-]
+Output your findings as a JSON object with this structure:
+{
+    "decisions": [
+        {
+            "decision": "Description of the decision",
+            "made_by": "Person who made/announced it or null",
+            "context": "Brief context or reasoning",
+            "related_discussion": "Related discussion points"
+        }
+    ]
+}
 
 Guidelines:
 - Only include actual decisions, not proposals or suggestions
 - Be specific and factual
-- If no clear decisions were made, return an empty array []
+- If no clear decisions were made, return {"decisions": []}
 - Maximum 10 decisions per meeting"""
 
-DECISION_EXTRACTOR_USER_PROMPT = """Analyze the following meeting transcript and extract all key decisions made:
+_DECISION_EXTRACTOR_SYSTEM_MESSAGE = SystemMessage(content=DECISION_EXTRACTOR_SYSTEM_PROMPT)
+
+
+def _render_decision_prompt(title: str, participants: str, transcript: str) -> str:
+    """Render the decision extraction user prompt."""
+    return f"""Analyze the following meeting transcript and extract all key decisions made:
 
 Meeting Title: {title}
 Participants: {participants}
@@ -57,7 +68,7 @@ Participants: {participants}
 {transcript}
 --- END TRANSCRIPT ---
 
-Extract the decisions as a JSON array."""
+Extract the decisions as a JSON object."""
 
 
 async def decisions_node(state: AgentState) -> dict:
@@ -80,27 +91,20 @@ async def decisions_node(state: AgentState) -> dict:
     try:
         llm_service = get_llm_service()
         
-        # Use parsed transcript if available
-        transcript = state.get("parsed_transcript") or state["raw_transcript"]
-        participants = ", ".join(state.get("participants", [])) or "Not specified"
-        
         # Create the prompt
-        user_message = DECISION_EXTRACTOR_USER_PROMPT.format(
+        user_message = _render_decision_prompt(
             title=state["meeting_title"],
-            participants=participants,
-            transcript=transcript[:15000],
+            participants=state["participants_str"],
+            transcript=state["prompt_transcript"],  # Pre-sliced by the parser
         )
         
         messages = [
-            SystemMessage(content=DECISION_EXTRACTOR_SYSTEM_PROMPT),
+            _DECISION_EXTRACTOR_SYSTEM_MESSAGE,
             HumanMessage(content=user_message),
         ]
         
-        # Generate decision extraction
-        response = await llm_service.chat(messages)
-        
-        # Parse the JSON response
-        decisions = _parse_decisions(response)
+        # Generate decision extraction, parsing items as they stream in
+        decisions = await _stream_decisions(llm_service, messages)
         
         logger.info(f"Extracted {len(decisions)} decisions")
         
@@ -116,58 +120,32 @@ async def decisions_node(state: AgentState) -> dict:
         }
 
 
-def _parse_decisions(response: str) -> list[Decision]:
-    """
-    Parse the LLM response into Decision objects.
-    
-    Args:
-        response: LLM response containing JSON
-    
-    Returns:
-        List of Decision objects
+async def _stream_decisions(
+    llm_service: LLMService,
+    messages: list[BaseMessage],
+) -> list[Decision]:
     """
-    decisions = []
-    
-    try:
-        # Find JSON array in response
-        json_str = _extract_json_array(response)
-        
-        if json_str:
-            data = json.loads(json_str)
-            
-            for item in data:
-                if isinstance(item, dict) and "decision" in item:
-                    decisions.append(
-                        Decision(
-                            decision=item.get("decision", ""),
-                            made_by=item.get("made_by"),
-                            context=item.get("context"),
-                            related_discussion=item.get("related_discussion"),
-                        )
-                    )
-    except json.JSONDecodeError as e:
-        logger.warning(f"Failed to parse decisions JSON: {e}")
-    except Exception as e:
-        logger.error(f"Error parsing decisions: {e}")
+    Stream the LLM response and parse Decision objects as they complete.
     
-    return decisions
-
-
-def _extract_json_array(text: str) -> str | None:
-    """
-    Extract JSON array from text that may contain other content.
+    Items are picked out of the "decisions" array while the LLM is still
+    generating. Once the array closes or MAX_DECISIONS items have arrived,
+    the stream is closed so the rest of the decode is never paid for.
     
     Args:
-        text: Text containing JSON array
+        llm_service: LLM service to stream from
+        messages: Prompt messages
     
     Returns:
-        The JSON array string, or None if not found
+        List of Decision objects
     """
-    # Find the first [ and last ]
-    start = text.find("[")
-    end = text.rfind("]")
+    parser = JsonArrayStreamParser()
+    items: list[dict] = []
     
-    if start != -1 and end != -1 and end > start:
-        return text[start:end + 1]
+    # JSON mode guarantees syntactically valid JSON with no prose around it
+    async with aclosing(llm_service.chat_stream(messages, json_mode=True)) as stream:
+        async for chunk in stream:
+            items.extend(item for item in parser.feed(chunk) if "decision" in item)
+            if parser.done or len(items) >= MAX_DECISIONS:
+                break
     
-    return None
+    return validate_items(Decision, items[:MAX_DECISIONS])
@@ -0,0 +1,117 @@
+"""
+Extraction Node - Concurrent Decision and Action Item Extraction
+
+This node runs the decision extractor and the action item agent
+concurrently, so the two LLM round-trips overlap instead of adding up.
+Successful results are cached by prompt-input hash, and optionally by
+transcript embedding for near-duplicates (see agents/cache.py).
+"""
+
+import asyncio
+import logging
+
+from ...services import get_embedding_service
+from ..cache import get_analysis_cache, get_semantic_cache, make_cache_key
+from ..state import AgentState, merge_errors
+from .actions import actions_node
+from .decisions import decisions_node
+
+logger = logging.getLogger(__name__)
+
+
+async def extract_node(state: AgentState) -> dict:
+    """
+    LangGraph node that extracts decisions and action items in one step.
+    
+    This node:
+    1. Returns cached results if this exact (or, with the semantic cache
+       enabled, a near-identical) transcript was already extracted,
+       unless state["force"] is set
+    2. Launches decisions_node and actions_node with asyncio.gather
+    3. Isolates failures so one branch can't null out the other's results
+    4. Merges both updates (and any error messages) into one state update
+    
+    Args:
+        state: Current agent state
+    
+    Returns:
+        Updated state with decisions and action_items lists
+    """
+    logger.info(f"Extracting decisions and action items for meeting: {state['meeting_id']}")
+    
+    # The key covers everything that goes into the extraction prompts
+    cache = get_analysis_cache()
+    cache_key = make_cache_key(
+        state["meeting_title"],
+        state["participants_str"],
+        state["prompt_transcript"],
+    )
+    
+    # A forced re-analysis skips both lookups but still caches its result
+    force = state.get("force", False)
+    
+    cached = None if force else cache.get(cache_key)
+    if cached is not None:
+        decisions, action_items = cached
+        logger.info(f"Extraction cache hit (stats: {cache.stats})")
+        return {
+            "decisions": list(decisions),
+            "action_items": list(action_items),
+        }
+    
+    # Near-duplicate lookup (only when enabled: costs one embedding call)
+    semantic_cache = get_semantic_cache()
+    embedding = None
+    if semantic_cache is not None:
+        try:
+            embedding = await get_embedding_service().embed_text(state["prompt_transcript"])
+        except Exception as e:
+            logger.warning(f"Skipping semantic cache, embedding failed: {e}")
+        
+        # (still embedded when forced, so the fresh result can be stored)
+        cached = semantic_cache.get(embedding) if embedding is not None and not force else None
+        if cached is not None:
+            decisions, action_items = cached
+            logger.info(f"Semantic cache hit (stats: {semantic_cache.stats})")
+            return {
+                "decisions": list(decisions),
+                "action_items": list(action_items),
+            }
+    
+    decisions_update, actions_update = await asyncio.gather(
+        decisions_node(state),
+        actions_node(state),
+        return_exceptions=True,
+    )
+    
+    # Each node already catches its own errors, but guard against anything
+    # that escapes so the other branch's results are still kept
+    if isinstance(decisions_update, BaseException):
+        logger.error(f"Error extracting decisions: {decisions_update}")
+        decisions_update = {
+            "error": f"Failed to extract decisions: {str(decisions_update)}",
+            "decisions": [],
+        }
+    if isinstance(actions_update, BaseException):
+        logger.error(f"Error extracting action items: {actions_update}")
+        actions_update = {
+            "error": f"Failed to extract action items: {str(actions_update)}",
+            "action_items": [],
+        }
+    
+    update = {
+        "decisions": decisions_update.get("decisions", []),
+        "action_items": actions_update.get("action_items", []),
+    }
+    
+    error = merge_errors(decisions_update.get("error"), actions_update.get("error"))
+    if error:
+        update["error"] = error
+    else:
+        # Only cache clean runs so failures are retried next time
+        result = (update["decisions"], update["action_items"])
+        cache.set(cache_key, result)
+        if semantic_cache is not None and embedding is not None:
+            semantic_cache.set(embedding, result)
+    
+    return update
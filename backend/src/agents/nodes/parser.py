@@ -5,35 +5,78 @@ This node parses and normalizes meeting transcripts,
 extracting speaker labels, timestamps, and structured text.
 """
 
+import asyncio
 import logging
 import re
+import sys
+from collections.abc import Iterator
 from typing import Any
 
+from ...config import get_settings
 from ...models import TranscriptSegment
+from ...utils import truncate_tokens
 from ..state import AgentState
 
 logger = logging.getLogger(__name__)
 
 
-# Common transcript patterns
-PATTERNS = {
-    # [00:05:23] Speaker Name: Text
-    "bracket_timestamp": re.compile(
-        r"\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*([^:]+):\s*(.+)"
-    ),
-    # 00:05:23 - Speaker Name: Text
-    "dash_timestamp": re.compile(
-        r"(\d{1,2}:\d{2}(?::\d{2})?)\s*[-–]\s*([^:]+):\s*(.+)"
-    ),
-    # Speaker Name (00:05:23): Text
-    "paren_timestamp": re.compile(
-        r"([^(]+)\s*\((\d{1,2}:\d{2}(?::\d{2})?)\):\s*(.+)"
-    ),
-    # Speaker Name: Text (no timestamp)
-    "simple_speaker": re.compile(
-        r"^([A-Z][a-zA-Z\s]+):\s*(.+)"
-    ),
-}
+# Common transcript formats, combined into one alternation so a single
+# match() call picks the right format instead of trying each pattern in turn.
+# Branches are tried in this order; each uses its own named groups.
+#
+# Anchored per line (re.MULTILINE) so parse_transcript can run it over the
+# whole transcript with finditer(). [^\S\n] is "whitespace except newline",
+# which keeps every match on a single line.
+#
+# The pattern is written so it never backtracks: every repeat that is
+# followed by a character it can't match is possessive (*+, ++), and there is
+# no separate whitespace run next to a speaker group (speakers are stripped
+# afterwards anyway). Matching is then a single left-to-right scan per branch.
+# The possessive leading indent also makes it behave like line.strip().
+#
+# The branches also start with distinct character classes ("[", a digit, an
+# uppercase letter), so the engine rejects non-applicable branches on the
+# first character. No separate Python-level dispatch on line[0] is needed.
+#
+# Keep this a module-level compiled pattern and don't switch to
+# re.match(pattern_str, ...): re's internal cache of compiled patterns is
+# small and shared by every module, so a string pattern on this hot path can
+# get evicted and silently recompiled.
+TRANSCRIPT_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*+(?:"
+    + "|".join([
+        # [00:05:23] Speaker Name: Text
+        r"\[(?P<ts_bracket>\d{1,2}:\d{2}(?::\d{2})?)\](?P<sp_bracket>[^:\n]++):[^\S\n]*+(?P<tx_bracket>\S.*)",
+        # 00:05:23 - Speaker Name: Text
+        r"(?P<ts_dash>\d{1,2}:\d{2}(?::\d{2})?)[^\S\n]*+[-–](?P<sp_dash>[^:\n]++):[^\S\n]*+(?P<tx_dash>\S.*)",
+        # Speaker Name (00:05:23): Text
+        r"(?P<sp_paren>[^(\n]++)\((?P<ts_paren>\d{1,2}:\d{2}(?::\d{2})?)\):[^\S\n]*+(?P<tx_paren>\S.*)",
+        # Speaker Name: Text (no timestamp)
+        r"(?P<sp_simple>[A-Z](?:[a-zA-Z]|[^\S\n])++):[^\S\n]*+(?P<tx_simple>\S.*)",
+    ])
+    + ")",
+    re.MULTILINE,
+)
+
+
+# (speaker, timestamp, text) - segments are handled as plain tuples while
+# parsing and only turned into TranscriptSegment models where needed
+_Row = tuple[str, str, str]
+
+
+def _match_to_row(match: re.Match) -> _Row:
+    """Convert a TRANSCRIPT_LINE_PATTERN match into a (speaker, timestamp, text) row."""
+    # The text group is the last one in every branch, so lastgroup
+    # tells us which format matched (e.g. "tx_bracket" -> "bracket")
+    kind = match.lastgroup[3:]
+    
+    # A handful of speaker names repeat on every line; interning makes all
+    # segments share one string per speaker (and equality checks cheap)
+    return (
+        sys.intern(match[f"sp_{kind}"].strip()),
+        match[f"ts_{kind}"] if kind != "simple" else "00:00",
+        match[f"tx_{kind}"].strip(),
+    )
 
 
 def parse_transcript_line(line: str) -> dict[str, Any] | None:
@@ -46,42 +89,99 @@ def parse_transcript_line(line: str) -> dict[str, Any] | None:
     Returns:
         Dictionary with speaker, timestamp, and text, or None if not parseable
     """
-    line = line.strip()
-    if not line:
+    # No strip() needed: the pattern skips leading indent itself and every
+    # captured field is stripped, so blank lines simply don't match
+    match = TRANSCRIPT_LINE_PATTERN.match(line)
+    if not match:
         return None
     
-    # Try each pattern
-    for pattern_name, pattern in PATTERNS.items():
-        match = pattern.match(line)
-        if match:
-            groups = match.groups()
-            
-            if pattern_name == "bracket_timestamp":
-                return {
-                    "timestamp": groups[0],
-                    "speaker": groups[1].strip(),
-                    "text": groups[2].strip(),
-                }
-            elif pattern_name == "dash_timestamp":
-                return {
-                    "timestamp": groups[0],
-                    "speaker": groups[1].strip(),
-                    "text": groups[2].strip(),
-                }
-            elif pattern_name == "paren_timestamp":
-                return {
-                    "timestamp": groups[1],
-                    "speaker": groups[0].strip(),
-                    "text": groups[2].strip(),
-                }
-            elif pattern_name == "simple_speaker":
-                return {
-                    "timestamp": "00:00",
-                    "speaker": groups[0].strip(),
-                    "text": groups[1].strip(),
-                }
-    
-    return None
+    speaker, timestamp, text = _match_to_row(match)
+    return {
+        "timestamp": timestamp,
+        "speaker": speaker,
+        "text": text,
+    }
+
+
+def _iter_rows(raw_transcript: str) -> Iterator[_Row]:
+    """
+    Parse a full transcript, yielding (speaker, timestamp, text) rows.
+    
+    The line pattern is run over the whole transcript in one finditer()
+    pass instead of splitting it and matching line by line. Any text
+    between two matches is unformatted and continues the previous row,
+    so each row is yielded once the next formatted line is found.
+    
+    Args:
+        raw_transcript: The raw transcript text
+    
+    Yields:
+        Rows in transcript order
+    """
+    pending: _Row | None = None
+    position = 0
+    
+    for match in TRANSCRIPT_LINE_PATTERN.finditer(raw_transcript):
+        pending = _append_continuation(pending, raw_transcript[position:match.start()])
+        if pending is not None:
+            yield pending
+        
+        pending = _match_to_row(match)
+        position = match.end()
+    
+    pending = _append_continuation(pending, raw_transcript[position:])
+    if pending is not None:
+        yield pending
+
+
+def _append_continuation(row: _Row | None, gap: str) -> _Row | None:
+    """
+    Add unformatted lines found between matched lines.
+    
+    Args:
+        row: Row the lines continue, or None at the start
+        gap: Transcript text between two matched lines
+    
+    Returns:
+        The continued row (a new one if there was none), or None
+    """
+    if not gap or gap.isspace():
+        return row
+    
+    # splitlines() also drops the \r of Windows (CRLF) line endings
+    lines = [line.strip() for line in gap.splitlines()]
+    lines = [line for line in lines if line]
+    if not lines:
+        return row
+    
+    if row is None:
+        # Lines before the first formatted one - treat as content
+        return ("Unknown", "00:00", " ".join(lines))
+    
+    # Continuation of previous speaker's text, joined once instead of
+    # growing the text with one += per line
+    speaker, timestamp, text = row
+    return (speaker, timestamp, " ".join([text, *lines]))
+
+
+def iter_transcript(raw_transcript: str) -> Iterator[TranscriptSegment]:
+    """
+    Parse a full transcript, yielding segments one at a time.
+    
+    Args:
+        raw_transcript: The raw transcript text
+    
+    Yields:
+        TranscriptSegment objects in transcript order
+    """
+    for speaker, timestamp, text in _iter_rows(raw_transcript):
+        # The pattern guarantees three plain strings, so pydantic
+        # validation would only re-check what is already known
+        yield TranscriptSegment.model_construct(
+            speaker=speaker,
+            timestamp=timestamp,
+            text=text,
+        )
 
 
 def parse_transcript(raw_transcript: str) -> list[TranscriptSegment]:
@@ -94,39 +194,12 @@ def parse_transcript(raw_transcript: str) -> list[TranscriptSegment]:
     Returns:
         List of TranscriptSegment objects
     """
-    segments: list[TranscriptSegment] = []
-    current_speaker = "Unknown"
-    current_timestamp = "00:00"
-    
-    for line in raw_transcript.split("\n"):
-        parsed = parse_transcript_line(line)
-        
-        if parsed:
-            segments.append(
-                TranscriptSegment(
-                    speaker=parsed["speaker"],
-                    timestamp=parsed["timestamp"],
-                    text=parsed["text"],
-                )
-            )
-            current_speaker = parsed["speaker"]
-            current_timestamp = parsed["timestamp"]
-        elif line.strip():
-            # Continuation of previous speaker's text
-            if segments:
-                # Append to previous segment
-                segments[-1].text += " " + line.strip()
-            else:
-                # First line without format - treat as content
-                segments.append(
-                    TranscriptSegment(
-                        speaker=current_speaker,
-                        timestamp=current_timestamp,
-                        text=line.strip(),
-                    )
-                )
-    
-    return segments
+    return list(iter_transcript(raw_transcript))
+
+
+def _format_segment(seg: TranscriptSegment) -> str:
+    """Format one segment as a normalized transcript line."""
+    return f"[{seg.timestamp}] {seg.speaker}: {seg.text}"
 
 
 def format_parsed_transcript(segments: list[TranscriptSegment]) -> str:
@@ -139,10 +212,11 @@ def format_parsed_transcript(segments: list[TranscriptSegment]) -> str:
     Returns:
         Formatted transcript string
     """
-    lines = []
-    for seg in segments:
-        lines.append(f"[{seg.timestamp}] {seg.speaker}: {seg.text}")
-    return "\n".join(lines)
+    return "\n".join(map(_format_segment, segments))
+
+
+# Speaker values that don't name a real participant
+_NON_PARTICIPANTS = frozenset({"", "Unknown"})
 
 
 def extract_participants(segments: list[TranscriptSegment]) -> list[str]:
@@ -155,11 +229,72 @@ def extract_participants(segments: list[TranscriptSegment]) -> list[str]:
     Returns:
         List of unique speaker names
     """
-    speakers = set()
-    for seg in segments:
-        if seg.speaker and seg.speaker != "Unknown":
-            speakers.add(seg.speaker)
-    return sorted(list(speakers))
+    # Dedupe in one C-level pass; only the few unique names get sorted
+    return sorted({seg.speaker for seg in segments} - _NON_PARTICIPANTS)
+
+
+# Rough characters per token, for the error fallback in parser_node
+_FALLBACK_CHARS_PER_TOKEN = 4
+
+
+def build_prompt_inputs(transcript: str, participants: list[str]) -> dict[str, str]:
+    """
+    Prepare the transcript and participant strings used by every LLM prompt.
+    
+    Computed once here so the summarizer and both extractors reuse the same
+    strings instead of each re-slicing the transcript and re-joining names.
+    
+    Args:
+        transcript: Normalized (or raw) transcript text
+        participants: List of speaker names
+    
+    Returns:
+        Dict with prompt_transcript and participants_str state fields
+    """
+    settings = get_settings()
+    return {
+        "prompt_transcript": truncate_tokens(
+            transcript, settings.prompt_max_tokens, settings.openai_model
+        ),
+        "participants_str": ", ".join(participants) or "Not specified",
+    }
+
+
+def _parse_for_state(raw_transcript: str) -> dict:
+    """
+    Parse a transcript into the parser node's state updates.
+    
+    Plain synchronous CPU work; parser_node runs it in a worker thread.
+    
+    Args:
+        raw_transcript: The raw transcript text
+    
+    Returns:
+        Updated state fields
+    """
+    # Parse and format in a single pass over plain rows (no
+    # TranscriptSegment is built here). Speakers are kept as a column
+    # so participants come from one C-level set() instead of a
+    # per-row check in Python.
+    lines: list[str] = []
+    speakers: list[str] = []
+    for speaker, timestamp, text in _iter_rows(raw_transcript):
+        lines.append(f"[{timestamp}] {speaker}: {text}")
+        speakers.append(speaker)
+    
+    participants = sorted(set(speakers) - _NON_PARTICIPANTS)
+    parsed_transcript = "\n".join(lines)
+    
+    logger.info(
+        f"Parsed {len(lines)} segments, "
+        f"found {len(participants)} participants"
+    )
+    
+    return {
+        "parsed_transcript": parsed_transcript,
+        "participants": participants,
+        **build_prompt_inputs(parsed_transcript or raw_transcript, participants),
+    }
 
 
 async def parser_node(state: AgentState) -> dict:
@@ -170,6 +305,7 @@ async def parser_node(state: AgentState) -> dict:
     1. Parses the raw transcript into structured segments
     2. Extracts participant names
     3. Creates a normalized transcript format
+    4. Prepares the shared prompt inputs for the LLM nodes
     
     Args:
         state: Current agent state
@@ -180,31 +316,19 @@ async def parser_node(state: AgentState) -> dict:
     logger.info(f"Parsing transcript for meeting: {state['meeting_id']}")
     
     try:
-        raw_transcript = state["raw_transcript"]
-        
-        # Parse the transcript
-        segments = parse_transcript(raw_transcript)
-        
-        # Extract participants
-        participants = extract_participants(segments)
-        
-        # Format normalized transcript
-        parsed_transcript = format_parsed_transcript(segments)
-        
-        logger.info(
-            f"Parsed {len(segments)} segments, "
-            f"found {len(participants)} participants"
-        )
-        
-        return {
-            "parsed_transcript": parsed_transcript,
-            "participants": participants,
-        }
+        # Parsing and tokenizing a long transcript is CPU-bound; running it
+        # in a thread keeps the event loop free to serve other requests
+        return await asyncio.to_thread(_parse_for_state, state["raw_transcript"])
     
     except Exception as e:
         logger.error(f"Error parsing transcript: {e}")
+        # No tokenizer here, since it may be what just failed; a plain
+        # character slice can't raise
+        max_chars = get_settings().prompt_max_tokens * _FALLBACK_CHARS_PER_TOKEN
         return {
             "error": f"Failed to parse transcript: {str(e)}",
             "parsed_transcript": state["raw_transcript"],
             "participants": [],
+            "prompt_transcript": state["raw_transcript"][:max_chars],
+            "participants_str": "Not specified",
         }
@@ -2,18 +2,36 @@
 Summarizer Node - Meeting Summary Generation
 
 This node generates a high-level overview of the meeting
-discussion using the LLM.
+discussion using the LLM. Transcripts over the prompt token budget
+are summarized map-reduce style so the whole meeting is covered.
+Successful summaries are cached by transcript hash (see agents/cache.py).
 """
 
+import asyncio
 import logging
+import re
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from ...services import get_llm_service
+from ...config import get_settings
+from ...services import LLMService, get_llm_service
+from ...utils import split_tokens
+from ..cache import get_analysis_cache, make_cache_key
 from ..state import AgentState
 
 logger = logging.getLogger(__name__)
 
+# Patterns used to pull the key topics list out of the summary text.
+# The header pattern is anchored to the start of a line (optionally after a
+# "#" heading marker or "**"), so the phrase in ordinary prose such as
+# "we reviewed the key topics" is not mistaken for the section header.
+_TOPICS_HEADER_RE = re.compile(
+    r"^[^\S\n]*(?:#+|\*\*)?[^\S\n]*(?:key topics|topics discussed)",
+    re.IGNORECASE | re.MULTILINE,
+)
+_SECTION_END_RE = re.compile(r"^[^\S\n]*#", re.MULTILINE)
+_BULLET_RE = re.compile(r"^[^\S\n]*[-•*][-•* ]*(.*)$", re.MULTILINE)
+
 SUMMARIZER_SYSTEM_PROMPT = """You are an expert meeting analyst. Your task is to create a concise, 
 high-level summary of a meeting transcript.
 
@@ -40,7 +58,13 @@ Output format:
 - Topic 3
 ..."""
 
-SUMMARIZER_USER_PROMPT = """Please analyze and summarize the following meeting transcript:
+# Built once and reused; the system message is the same for every call
+_SUMMARIZER_SYSTEM_MESSAGE = SystemMessage(content=SUMMARIZER_SYSTEM_PROMPT)
+
+
+def _render_summarizer_prompt(title: str, participants: str, transcript: str) -> str:
+    """Render the summarizer user prompt."""
+    return f"""Please analyze and summarize the following meeting transcript:
 
 Meeting Title: {title}
 Participants: {participants}
@@ -52,14 +76,62 @@ Participants: {participants}
 Provide a high-level summary and extract the key topics discussed."""
 
 
+# Long meetings are summarized map-reduce style: each token window of the
+# transcript is condensed into notes in parallel, then the notes are
+# summarized with the regular prompt above.
+CHUNK_NOTES_SYSTEM_PROMPT = """You are an expert meeting analyst. You will receive ONE PART of a 
+longer meeting transcript.
+
+Write concise notes on this part only:
+- Topics discussed
+- Important points, and who raised them
+- Any decisions, agreements, or assigned tasks
+
+Guidelines:
+- Use short bullet points
+- Use exact participant names
+- Do not speculate about other parts of the meeting"""
+
+_CHUNK_NOTES_SYSTEM_MESSAGE = SystemMessage(content=CHUNK_NOTES_SYSTEM_PROMPT)
+
+
+def _render_chunk_notes_prompt(title: str, part: int, total: int, transcript: str) -> str:
+    """Render the per-window notes user prompt."""
+    return f"""Write notes on the following part of a meeting transcript:
+
+Meeting Title: {title}
+Part: {part} of {total}
+
+--- TRANSCRIPT PART ---
+{transcript}
+--- END TRANSCRIPT PART ---"""
+
+
+def _render_combine_prompt(title: str, participants: str, notes: str) -> str:
+    """Render the user prompt that summarizes the per-window notes."""
+    return f"""Please analyze and summarize the following meeting. The transcript was too long 
+to include, so it is given as notes on its consecutive parts:
+
+Meeting Title: {title}
+Participants: {participants}
+
+--- MEETING NOTES ---
+{notes}
+--- END MEETING NOTES ---
+
+Provide a high-level summary and extract the key topics discussed."""
+
+
 async def summarizer_node(state: AgentState) -> dict:
     """
     LangGraph node that generates meeting summaries.
     
     This node:
-    1. Takes the parsed transcript
-    2. Uses the LLM to generate a summary
-    3. Extracts key topics from the meeting
+    1. Returns the cached summary if this exact transcript was already
+       summarized (re-uploads), unless state["force"] is set
+    2. Takes the parsed transcript
+    3. Uses the LLM to generate a summary
+    4. Extracts key topics from the meeting
     
     Args:
         state: Current agent state
@@ -69,22 +141,49 @@ async def summarizer_node(state: AgentState) -> dict:
     """
     logger.info(f"Generating summary for meeting: {state['meeting_id']}")
     
+    # The full transcript determines the prompt(s) whether or not it is
+    # windowed; the "summary" part keeps keys apart from extract_node's
+    full_transcript = state["parsed_transcript"] or state["raw_transcript"]
+    cache = get_analysis_cache()
+    cache_key = make_cache_key(
+        "summary",
+        state["meeting_title"],
+        state["participants_str"],
+        full_transcript,
+    )
+    
+    # A forced re-analysis skips the lookup but still caches its result
+    cached = None if state.get("force") else cache.get(cache_key)
+    if cached is not None:
+        summary, key_topics = cached
+        logger.info(f"Summary cache hit (stats: {cache.stats})")
+        return {
+            "summary": summary,
+            "key_topics": list(key_topics),
+        }
+    
     try:
         llm_service = get_llm_service()
         
-        # Use parsed transcript if available, otherwise raw
-        transcript = state.get("parsed_transcript") or state["raw_transcript"]
-        participants = ", ".join(state.get("participants", [])) or "Not specified"
-        
-        # Create the prompt
-        user_message = SUMMARIZER_USER_PROMPT.format(
-            title=state["meeting_title"],
-            participants=participants,
-            transcript=transcript[:15000],  # Limit transcript length
-        )
+        # The parser cut prompt_transcript to the token budget. If that
+        # dropped anything, summarize the FULL transcript window by window
+        # instead, so the end of long meetings isn't silently lost.
+        if len(state["prompt_transcript"]) < len(full_transcript):
+            notes = await _summarize_windows(llm_service, state["meeting_title"], full_transcript)
+            user_message = _render_combine_prompt(
+                title=state["meeting_title"],
+                participants=state["participants_str"],
+                notes=notes,
+            )
+        else:
+            user_message = _render_summarizer_prompt(
+                title=state["meeting_title"],
+                participants=state["participants_str"],
+                transcript=state["prompt_transcript"],  # Pre-sliced by the parser
+            )
         
         messages = [
-            SystemMessage(content=SUMMARIZER_SYSTEM_PROMPT),
+            _SUMMARIZER_SYSTEM_MESSAGE,
             HumanMessage(content=user_message),
         ]
         
@@ -96,6 +195,8 @@ async def summarizer_node(state: AgentState) -> dict:
         
         logger.info(f"Summary generated, extracted {len(key_topics)} key topics")
         
+        cache.set(cache_key, (response, key_topics))
+        
         return {
             "summary": response,
             "key_topics": key_topics,
@@ -110,6 +211,43 @@ async def summarizer_node(state: AgentState) -> dict:
         }
 
 
+async def _summarize_windows(
+    llm_service: LLMService,
+    title: str,
+    transcript: str,
+) -> str:
+    """
+    Condense a long transcript into notes, one LLM call per token window.
+    
+    The calls run concurrently (capped by the LLM service), so this costs
+    about one extra round-trip regardless of the number of windows.
+    
+    Args:
+        llm_service: LLM service to call
+        title: Meeting title
+        transcript: Full transcript text
+    
+    Returns:
+        Notes for all windows, in transcript order
+    """
+    settings = get_settings()
+    windows = split_tokens(transcript, settings.prompt_max_tokens, settings.openai_model)
+    
+    logger.info(f"Transcript over token budget, summarizing {len(windows)} windows")
+    
+    notes = await asyncio.gather(*(
+        llm_service.chat([
+            _CHUNK_NOTES_SYSTEM_MESSAGE,
+            HumanMessage(content=_render_chunk_notes_prompt(title, i, len(windows), window)),
+        ])
+        for i, window in enumerate(windows, 1)
+    ))
+    
+    return "\n\n".join(
+        f"Part {i}:\n{part_notes}" for i, part_notes in enumerate(notes, 1)
+    )
+
+
 def _extract_key_topics(summary_text: str) -> list[str]:
     """
     Extract key topics from the summary response.
@@ -120,25 +258,21 @@ def _extract_key_topics(summary_text: str) -> list[str]:
     Returns:
         List of key topics
     """
-    topics = []
-    in_topics_section = False
-    
-    for line in summary_text.split("\n"):
-        line = line.strip()
+    for header in _TOPICS_HEADER_RE.finditer(summary_text):
+        # The section starts on the line after the header...
+        start = summary_text.find("\n", header.end())
+        if start == -1:
+            break
         
-        # Check for topics section header
-        if "key topics" in line.lower() or "topics discussed" in line.lower():
-            in_topics_section = True
-            continue
+        # ...and runs until the next markdown heading
+        section_end = _SECTION_END_RE.search(summary_text, start)
+        end = section_end.start() if section_end else len(summary_text)
         
-        # Check for end of topics section
-        if in_topics_section and line.startswith("#"):
-            break
+        topics = (topic.strip() for topic in _BULLET_RE.findall(summary_text, start, end))
         
-        # Extract bullet points
-        if in_topics_section and (line.startswith("-") or line.startswith("•") or line.startswith("*")):
-            topic = line.lstrip("-•* ").strip()
-            if topic:
-                topics.append(topic)
+        # Lines repeating the header phrase are headers, not topics
+        topics = [topic for topic in topics if topic and not _TOPICS_HEADER_RE.match(topic)]
+        if topics:
+            return topics
     
-    return topics
+    return []
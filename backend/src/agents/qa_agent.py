@@ -58,13 +58,17 @@ ARCHITECTURE:
 =============================================================================
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional
 
+from langchain_core.documents import Document
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from ..services import get_llm_service
 from ..vectorstore import get_chroma_store
+from .cache import get_answer_cache, get_retrieval_cache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +94,9 @@ CRITICAL RULES:
 Context will be provided as excerpts from the meeting transcript.
 Each excerpt includes timestamps and speaker names for reference."""
 
+# Shared by every ask(): the system message never changes
+_QA_SYSTEM_MESSAGE = SystemMessage(content=QA_SYSTEM_PROMPT)
+
 
 QA_USER_PROMPT = """Based on the following meeting context, answer the question.
 
@@ -184,6 +191,16 @@ class QAAgent:
         """
         logger.info(f"Answering question: {question[:50]}...")
         
+        # Repeat questions (page refreshes, the same question re-asked) are
+        # answered from the cache without any embedding or LLM call
+        answer_cache = get_answer_cache()
+        key = self._retrieval_key(question, meeting_id, num_chunks)
+        
+        cached = answer_cache.get(key)
+        if cached is not None:
+            logger.debug("Answer cache hit")
+            return dict(cached)
+        
         # -----------------------------------------------------------------------
         # STEP 1: Retrieve relevant context using semantic search
         # -----------------------------------------------------------------------
@@ -194,26 +211,44 @@ class QAAgent:
         # - Question → Embedding vector (via OpenAI embeddings)
         # - Compare against all stored transcript chunks
         # - Return top-K most similar (cosine similarity)
-        documents = self.vector_store.search(
-            query=question,
-            meeting_id=meeting_id,
-            k=num_chunks,
-        )
+        documents = await self._retrieve(question, meeting_id, num_chunks)
+        
+        result = await self._answer(question, documents, meeting_id)
+        answer_cache.set(key, result)
+        return dict(result)
+    
+    async def _answer(
+        self,
+        question: str,
+        documents: list[Document],
+        meeting_id: Optional[str],
+    ) -> dict:
+        """
+        Generate an answer from already retrieved context chunks.
+        
+        Args:
+            question: The user's question
+            documents: Retrieved context chunks
+            meeting_id: Meeting that was queried (echoed in the result)
         
+        Returns:
+            dict with answer, sources and meeting_id (see ask())
+        """
         # -----------------------------------------------------------------------
         # STEP 2: Build context from retrieved documents
         # -----------------------------------------------------------------------
         # Combine all retrieved chunks into a single context string
         # Each chunk includes its position to help the LLM understand structure
-        sources = []
-        context_parts = []
+        sources = [doc.page_content for doc in documents]
         
-        for i, doc in enumerate(documents, 1):
-            content = doc.page_content
-            sources.append(content)
-            context_parts.append(f"[Excerpt {i}]: {content}")
+        # Label, content and separator are collected as separate pieces and
+        # joined once, so each chunk's text is copied only into the final
+        # context string (not first into a per-chunk f-string)
+        context_parts: list[str] = []
+        for i, content in enumerate(sources, 1):
+            context_parts += (f"[Excerpt {i}]: ", content, "\n\n")
         
-        context = "\n\n".join(context_parts)
+        context = "".join(context_parts[:-1])
         
         # Handle case where no relevant context was found
         if not context:
@@ -236,7 +271,7 @@ class QAAgent:
         )
         
         messages = [
-            SystemMessage(content=QA_SYSTEM_PROMPT),
+            _QA_SYSTEM_MESSAGE,
             HumanMessage(content=user_message),
         ]
         
@@ -257,17 +292,74 @@ class QAAgent:
             "sources": sources,
             "meeting_id": meeting_id,
         }
+    
+    async def _retrieve(
+        self,
+        question: str,
+        meeting_id: Optional[str],
+        num_chunks: int,
+    ) -> list[Document]:
+        """
+        Retrieve context chunks for a question, reusing cached results.
+        
+        Repeat questions ("What are the action items?") skip the embedding
+        call and vector search. The store version is part of the key, so
+        any upload or delete makes older entries unreachable. Answers are
+        cached separately under the same key (see ask()), so a deleted
+        meeting's answers go stale together with its retrievals.
+        
+        Args:
+            question: The user's question
+            meeting_id: Optional meeting filter
+            num_chunks: Number of chunks to retrieve
+        
+        Returns:
+            List of retrieved Document objects
+        """
+        cache = get_retrieval_cache()
+        key = self._retrieval_key(question, meeting_id, num_chunks)
+        
+        documents = cache.get(key)
+        if documents is None:
+            # The search (embedding call + Chroma query) is blocking I/O,
+            # so it runs in a thread instead of stalling the event loop
+            documents = await asyncio.to_thread(
+                self.vector_store.search,
+                query=question,
+                meeting_id=meeting_id,
+                k=num_chunks,
+            )
+            cache.set(key, documents)
+        else:
+            logger.debug("Retrieval cache hit")
+        
+        return documents
+    
+    def _retrieval_key(
+        self,
+        question: str,
+        meeting_id: Optional[str],
+        num_chunks: int,
+    ) -> str:
+        """Build the retrieval/answer cache key (case and whitespace insensitive)."""
+        return make_cache_key(
+            str(self.vector_store.version),
+            meeting_id or "",
+            " ".join(question.lower().split()),
+            str(num_chunks),
+        )
 
 
+@lru_cache()
 def get_qa_agent() -> QAAgent:
     """
-    Factory function to get a QAAgent instance.
+    Get the QAAgent instance (singleton).
     
-    NOTE: This creates a NEW instance each time (not a singleton).
-    This is fine because the underlying services (LLM, Vector Store)
-    are singletons, so we're not duplicating expensive resources.
+    The agent holds no per-request state (the retrieval cache is a
+    separate shared singleton), so one instance is shared by all requests
+    instead of constructing a new one per question.
     
     Returns:
-        QAAgent: New Q&A agent instance
+        QAAgent: Shared Q&A agent instance
     """
     return QAAgent()
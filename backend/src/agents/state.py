@@ -48,14 +48,35 @@ TypedDict (from typing module) provides:
 We use TypedDict instead of Pydantic here because LangGraph expects
 regular dicts for state management and merging.
 
+The same goes for dataclasses (even with slots=True): LangGraph keeps
+each field in its own channel and, for a dataclass or Pydantic schema,
+builds a NEW instance from those channels before every node runs. With
+TypedDict the node just gets a plain dict, so it's also the fastest
+schema, not only the simplest.
+
 =============================================================================
 """
 
-from typing import Optional, TypedDict
+from typing import Annotated, Optional, TypedDict
 
 from ..models import ActionItem, Decision
 
 
+def merge_errors(left: Optional[str], right: Optional[str]) -> Optional[str]:
+    """
+    Reducer for the `error` field.
+    
+    The decisions and actions extractors run concurrently and may both
+    report an error in the same step. This reducer joins the messages
+    instead of letting one overwrite the other.
+    """
+    if not left:
+        return right
+    if not right or right == left:
+        return left
+    return f"{left}; {right}"
+
+
 class AgentState(TypedDict, total=False):
     """
     State structure for the meeting analysis LangGraph.
@@ -81,26 +102,16 @@ class AgentState(TypedDict, total=False):
                                    ▼
     ┌─────────────────────────────────────────────────────────────────┐
     │                      PARSER NODE OUTPUT                          │
-    │  parsed_transcript, participants                                 │
-    └──────────────────────────────┬──────────────────────────────────┘
-                                   │
-                                   ▼
-    ┌─────────────────────────────────────────────────────────────────┐
-    │                    SUMMARIZER NODE OUTPUT                        │
-    │  summary, key_topics                                             │
-    └──────────────────────────────┬──────────────────────────────────┘
-                                   │
-                                   ▼
-    ┌─────────────────────────────────────────────────────────────────┐
-    │                    DECISIONS NODE OUTPUT                         │
-    │  decisions                                                       │
+    │  parsed_transcript, participants, prompt_transcript, ...         │
     └──────────────────────────────┬──────────────────────────────────┘
                                    │
                                    ▼
-    ┌─────────────────────────────────────────────────────────────────┐
-    │                     ACTIONS NODE OUTPUT                          │
-    │  action_items                                                    │
-    └─────────────────────────────────────────────────────────────────┘
+    ┌──────────────────────────┐ ┌────────────────────────────────────┐
+    │  SUMMARIZER NODE OUTPUT  │ │        EXTRACT NODE OUTPUT         │
+    │  summary, key_topics     │ │  decisions, action_items           │
+    └──────────────────────────┘ └────────────────────────────────────┘
+        (both branches run in parallel after the parser; the extract
+         node produces decisions and action items concurrently)
     """
     
     # =========================================================================
@@ -124,6 +135,12 @@ class AgentState(TypedDict, total=False):
     - Speaker: Text (no timestamp)
     """
     
+    force: bool
+    """
+    Re-run the LLM calls even if cached results exist (?force=true).
+    Fresh results are still written to the caches.
+    """
+    
     # =========================================================================
     # Parser Node Output
     # =========================================================================
@@ -141,6 +158,17 @@ class AgentState(TypedDict, total=False):
     Example: ["Alice", "Bob", "Carol"]
     """
     
+    prompt_transcript: Optional[str]
+    """
+    Transcript text as sent to the LLM (truncated to prompt_max_tokens).
+    Shared by the summarizer and both extractors.
+    """
+    
+    participants_str: Optional[str]
+    """
+    Participants joined for prompts, e.g. "Alice, Bob" or "Not specified".
+    """
+    
     # =========================================================================
     # Summarizer Node Output
     # =========================================================================
@@ -185,8 +213,9 @@ class AgentState(TypedDict, total=False):
     # =========================================================================
     # Nodes can set this field to report errors without crashing.
     
-    error: Optional[str]
+    error: Annotated[Optional[str], merge_errors]
     """
     Error message if any node encountered a problem.
     When set, downstream nodes can check this and handle gracefully.
+    Messages from concurrent extractors are joined with "; " (see merge_errors).
     """
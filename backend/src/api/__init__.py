@@ -1,5 +1,6 @@
 """API module for AI Meeting Intelligence System."""
 
+from .middleware import RequestTimingMiddleware
 from .routes import router
 
-__all__ = ["router"]
+__all__ = ["RequestTimingMiddleware", "router"]
@@ -0,0 +1,56 @@
+"""
+ASGI Middleware for AI Meeting Intelligence System
+
+=============================================================================
+WHY PURE ASGI?
+=============================================================================
+
+Starlette's BaseHTTPMiddleware builds Request/Response objects for every
+request and runs the rest of the app in a separate task, which adds
+noticeable latency per middleware and breaks streaming responses in
+subtle ways. Middleware in this app is written as plain ASGI callables
+instead: they only see the scope/receive/send dicts and wrap `send`.
+
+Do not add BaseHTTPMiddleware subclasses (or @app.middleware("http")
+functions, which use it under the hood); follow RequestTimingMiddleware.
+=============================================================================
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestTimingMiddleware:
+    """
+    Add an X-Response-Time header (milliseconds) to every HTTP response.
+    
+    The time is measured up to the start of the response (status and
+    headers), so for streamed responses it is the time to first byte.
+    
+    USAGE:
+    ------
+        app.add_middleware(RequestTimingMiddleware)
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # WebSockets and lifespan events pass straight through
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start = time.perf_counter()
+        
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-response-time", f"{elapsed_ms:.1f}ms".encode()),
+                ]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_timing)
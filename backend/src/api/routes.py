@@ -33,24 +33,42 @@ DATA FLOW EXAMPLE (Transcript Upload):
     1. Client POSTs transcript text to /transcripts/upload
     2. Backend parses transcript into segments
     3. Segments are stored in ChromaDB (vector store)
-    4. Meeting is added to in-memory meeting list
+    4. Meeting is saved to the meeting store (SQLite)
     5. Response includes meeting_id for future operations
 
 =============================================================================
 """
 
+import asyncio
+import codecs
 import logging
-import uuid
+import os
+import secrets
+import time
+from collections.abc import Iterator
 from typing import Optional
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+import orjson
+from fastapi import (
+    APIRouter,
+    File,
+    Form,
+    HTTPException,
+    Response,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 # Import our internal modules
-from ..agents import MeetingAnalyzer, get_qa_agent
+from ..agents import get_meeting_analyzer, get_qa_agent
 from ..agents.nodes import parse_transcript
 from ..models import Meeting, TranscriptSegment
-from ..services import get_whisper_service
+from ..services import StreamingTranscriber, get_whisper_service
+from ..services.whisper_service import SAMPLE_RATE
+from ..storage import get_meeting_store
 from ..vectorstore import get_chroma_store
 
 logger = logging.getLogger(__name__)
@@ -64,13 +82,23 @@ router = APIRouter()
 
 
 # =============================================================================
-# IN-MEMORY MEETING STORAGE
+# MEETING STORAGE
 # =============================================================================
-# For this demo/prototype, we store meetings in memory.
+# Meetings are persisted in SQLite with a bounded in-memory cache of recently
+# used Meeting objects (see storage/meeting_store.py).
 # PRODUCTION NOTE: Replace with a proper database (PostgreSQL, etc.)
-#
-# Structure: {meeting_id: Meeting object}
-meetings_db: dict[str, Meeting] = {}
+
+
+def _new_meeting_id() -> str:
+    """
+    Generate a unique, time-ordered meeting ID.
+    
+    32 hex characters laid out like a UUIDv7: a 48-bit millisecond
+    timestamp followed by 80 random bits. IDs sort by creation time, so
+    new meetings are appended to the end of the SQLite primary-key index
+    instead of landing on random pages.
+    """
+    return f"{time.time_ns() // 1_000_000:012x}{secrets.token_hex(10)}"
 
 
 # =============================================================================
@@ -128,48 +156,90 @@ async def upload_transcript(request: TranscriptUploadRequest):
         - Speaker: Text (no timestamp)
     """
     try:
-        # Generate unique ID for this meeting
-        meeting_id = str(uuid.uuid4())
-        
-        # Parse transcript into structured segments
-        # This extracts: timestamp, speaker, text for each line
-        segments = parse_transcript(request.transcript)
-        
-        # Extract unique participant names from segments
-        participants = list({seg.speaker for seg in segments if seg.speaker})
-        
-        # Create Meeting object to store
-        meeting = Meeting(
-            id=meeting_id,
-            title=request.title,
-            raw_transcript=request.transcript,
-            segments=segments,
-            participants=participants,
+        # Parsing, embedding and storing are all blocking; running them in a
+        # worker thread lets concurrent uploads (and every other request)
+        # proceed while one meeting is being embedded
+        return await asyncio.to_thread(
+            _ingest_transcript, request.title, request.transcript
         )
-        
-        # Store in our in-memory "database"
-        meetings_db[meeting_id] = meeting
-        
-        # Add to vector store for semantic search
-        # This embeds each segment and stores in ChromaDB
-        vector_store = get_chroma_store()
-        vector_store.add_meeting(meeting)
-        
-        logger.info(
-            f"Uploaded meeting '{request.title}' with {len(segments)} segments"
-        )
-        
-        return {
-            "meeting_id": meeting_id,
-            "segment_count": len(segments),
-            "participants": participants,
-        }
-        
+    
     except Exception as e:
         logger.error(f"Failed to upload transcript: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _ingest_transcript(title: str, transcript: str) -> dict:
+    """
+    Parse, store and index a text transcript (blocking).
+    
+    Args:
+        title: Meeting title
+        transcript: Full transcript text
+    
+    Returns:
+        Upload response with meeting_id, segment_count and participants
+    """
+    # Generate unique ID for this meeting
+    meeting_id = _new_meeting_id()
+    
+    # Parse transcript into structured segments
+    # This extracts: timestamp, speaker, text for each line
+    segments = parse_transcript(transcript)
+    
+    # Extract unique participant names from segments
+    # (dict keys dedupe like a set but keep first-appearance order)
+    participants = list(dict.fromkeys(seg.speaker for seg in segments if seg.speaker))
+    
+    # Create Meeting object to store
+    meeting = Meeting(
+        id=meeting_id,
+        title=title,
+        raw_transcript=transcript,
+        segments=segments,
+        participants=participants,
+    )
+    
+    _store_meeting(meeting)
+    
+    logger.info(f"Uploaded meeting '{title}' with {len(segments)} segments")
+    
+    return {
+        "meeting_id": meeting_id,
+        "segment_count": len(segments),
+        "participants": participants,
+    }
+
+
+def _store_meeting(meeting: Meeting) -> None:
+    """Save a new meeting and add it to the vector store (blocking)."""
+    # Store in the meeting database
+    get_meeting_store().save(meeting)
+    
+    # Add to vector store for semantic search
+    # This embeds each segment and stores in ChromaDB
+    vector_store = get_chroma_store()
+    vector_store.add_meeting(meeting)
+
+
+# Uploads are read in chunks of this size
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _read_text_upload(file: UploadFile) -> str:
+    """
+    Read and UTF-8 decode an uploaded text file chunk by chunk.
+    
+    Decoding incrementally means the raw bytes of the whole file are never
+    held in memory next to the decoded text.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts = []
+    while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
 @router.post("/transcripts/upload-file")
 async def upload_transcript_file(
     file: UploadFile = File(...),
@@ -188,20 +258,17 @@ async def upload_transcript_file(
     """
     try:
         # Read file content
-        content = await file.read()
-        transcript_text = content.decode("utf-8")
+        transcript_text = await _read_text_upload(file)
         
         # Use filename as title if not provided
-        meeting_title = title or file.filename.replace(".txt", "")
+        # (splitext only drops the final extension, not ".txt" anywhere in the name)
+        meeting_title = title or os.path.splitext(file.filename or "")[0] or "Untitled Meeting"
         
         # Reuse the upload logic
-        request = TranscriptUploadRequest(
-            title=meeting_title,
-            transcript=transcript_text,
+        return await asyncio.to_thread(
+            _ingest_transcript, meeting_title, transcript_text
         )
-        
-        return await upload_transcript(request)
-        
+    
     except Exception as e:
         logger.error(f"Failed to upload file: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -244,71 +311,260 @@ async def transcribe_audio(
         # Get the Whisper service (singleton - model loaded once)
         whisper_service = get_whisper_service()
         
-        # Read audio file bytes
-        audio_bytes = await file.read()
-        
-        # Determine file extension from filename
-        file_ext = f".{file.filename.split('.')[-1]}" if file.filename else ".wav"
-        
-        # Transcribe using Whisper
+        # Transcribe using Whisper, decoding straight from the uploaded file
+        # (no full read into memory, no temp file copy)
         # Returns: (segments, detected_language, duration_seconds)
-        segments, detected_lang, duration = whisper_service.transcribe_bytes(
-            audio_bytes=audio_bytes,
-            file_extension=file_ext,
+        #
+        # Decoding and inference take seconds to minutes; in a worker thread
+        # they don't block the event loop, so other requests keep being
+        # served (CTranslate2 releases the GIL while it runs the model)
+        segments, detected_lang, duration = await asyncio.to_thread(
+            whisper_service.transcribe_stream,
+            file.file,
             language=language,
         )
         
         # Generate meeting ID and title
-        meeting_id = str(uuid.uuid4())
+        meeting_id = _new_meeting_id()
         meeting_title = title or file.filename or "Audio Transcription"
         
-        # Build raw transcript from segments
-        # Format: [timestamp] Speaker: text
-        raw_transcript = "\n".join([
-            f"[{seg.timestamp}] {seg.speaker}: {seg.text}"
-            for seg in segments
-        ])
-        
-        # Extract participants (Whisper doesn't do speaker diarization,
-        # so all segments have generic "Speaker" label)
-        participants = list({seg.speaker for seg in segments})
-        
         # Create and store meeting
-        meeting = Meeting(
-            id=meeting_id,
-            title=meeting_title,
-            raw_transcript=raw_transcript,
-            segments=segments,
-            participants=participants,
-        )
-        
-        meetings_db[meeting_id] = meeting
-        
-        # Add to vector store
-        vector_store = get_chroma_store()
-        vector_store.add_meeting(meeting)
+        meeting = _audio_meeting(meeting_id, meeting_title, segments)
+        await asyncio.to_thread(_store_meeting, meeting)
         
         logger.info(
             f"Transcribed audio '{meeting_title}': "
             f"{len(segments)} segments, {duration:.1f}s, language={detected_lang}"
         )
         
-        return {
+        # Long recordings produce thousands of segments; they are plain
+        # data after model_dump(), so jsonable_encoder's second walk over
+        # them is skipped by returning the response directly
+        return ORJSONResponse({
             "meeting_id": meeting_id,
             "segments": [seg.model_dump() for seg in segments],
             "language": detected_lang,
             "duration_seconds": duration,
-        }
+        })
+    
+    except Exception as e:
+        logger.error(f"Failed to transcribe audio: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/audio/transcribe/stream")
+async def transcribe_audio_stream(
+    file: UploadFile = File(...),
+    title: Optional[str] = Form(None),
+    language: Optional[str] = Form(None),
+):
+    """
+    Upload audio and receive segments while Whisper is still transcribing.
+    
+    Same input as /audio/transcribe, but the response is newline-delimited
+    JSON sent as segments are produced, so the first lines arrive within
+    seconds instead of after the whole recording has been transcribed.
+    
+    RESPONSE (application/x-ndjson, one object per line):
+        {"type": "start", "meeting_id": "...", "language": "en", "duration_seconds": 312.4}
+        {"type": "segment", "speaker": "Speaker", "timestamp": "00:00", "text": "...", ...}
+        ...
+        {"type": "done", "meeting_id": "...", "segment_count": 57}
+    
+    The meeting is stored once the last segment is done. If transcription
+    fails midway, the last line is {"type": "error", "detail": "..."} and
+    nothing is stored.
+    """
+    try:
+        whisper_service = get_whisper_service()
         
+        # Decodes the whole upload (and detects the language) up front, so
+        # the upload file isn't needed once the response starts streaming
+        segment_iter, detected_lang, duration = await asyncio.to_thread(
+            whisper_service.transcribe_iter,
+            file.file,
+            language=language,
+        )
     except Exception as e:
         logger.error(f"Failed to transcribe audio: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    meeting_id = _new_meeting_id()
+    meeting_title = title or file.filename or "Audio Transcription"
+    
+    async def stream_segments():
+        yield orjson.dumps({
+            "type": "start",
+            "meeting_id": meeting_id,
+            "language": detected_lang,
+            "duration_seconds": duration,
+        }) + b"\n"
+        
+        segments: list[TranscriptSegment] = []
+        try:
+            # Each next() transcribes the next stretch of audio, so it runs
+            # in a worker thread like the rest of the Whisper work
+            while (segment := await asyncio.to_thread(next, segment_iter, None)) is not None:
+                segments.append(segment)
+                yield orjson.dumps({"type": "segment", **segment.model_dump()}) + b"\n"
+            
+            await asyncio.to_thread(
+                _store_meeting, _audio_meeting(meeting_id, meeting_title, segments)
+            )
+        except Exception as e:
+            logger.error(f"Failed to transcribe audio: {e}")
+            yield orjson.dumps({"type": "error", "detail": str(e)}) + b"\n"
+            return
+        
+        logger.info(
+            f"Transcribed audio '{meeting_title}' (streamed): "
+            f"{len(segments)} segments, {duration:.1f}s, language={detected_lang}"
+        )
+        yield orjson.dumps({
+            "type": "done",
+            "meeting_id": meeting_id,
+            "segment_count": len(segments),
+        }) + b"\n"
+    
+    # Content-Encoding: identity keeps GZipMiddleware from buffering the
+    # lines (a few hundred bytes each) inside its compressor
+    return StreamingResponse(
+        stream_segments(),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "identity"},
+    )
+
+
+def _audio_meeting(meeting_id: str, title: str, segments: list[TranscriptSegment]) -> Meeting:
+    """Build the Meeting for a transcribed recording."""
+    return Meeting(
+        id=meeting_id,
+        title=title,
+        # No raw_transcript: it would only repeat the segments, so it
+        # is rendered from them when needed (Meeting.transcript_text())
+        segments=segments,
+        # Whisper doesn't do speaker diarization, so all segments have
+        # the generic "Speaker" label
+        participants=list(dict.fromkeys(seg.speaker for seg in segments)),
+    )
+
+
+# New audio needed before the next streaming transcription round
+_STREAM_STEP_SECONDS = 0.5
+
+
+def _words_payload(words: list[tuple[float, float, str]]) -> list[dict]:
+    """Format confirmed (start, end, text) words for the streaming socket."""
+    return [
+        {"start": round(start, 2), "end": round(end, 2), "text": text}
+        for start, end, text in words
+    ]
+
+
+@router.websocket("/audio/stream")
+async def stream_audio(websocket: WebSocket, language: Optional[str] = None):
+    """
+    Transcribe live audio while it is still being recorded/uploaded.
+    
+    Instead of waiting for the whole file (latency grows with its length),
+    words are sent back about a second after they are spoken.
+    
+    PROTOCOL:
+        Client → server:
+            - binary frames: 16 kHz mono signed 16-bit little-endian PCM
+              (any frame size, e.g. 20 ms)
+            - text frame "end": no more audio; flush and close
+        Server → client (JSON):
+            - {"type": "words", "words": [{"start", "end", "text"}, ...]}
+              newly confirmed words (never revised later)
+            - {"type": "final", "text": "..."} full transcript, then close
+            - {"type": "error", "detail": "..."} transcription failed, then
+              close (code 1011)
+    
+    Words are confirmed with LocalAgreement-2: a word is sent once two
+    consecutive transcription rounds agree on it (see StreamingTranscriber).
+    """
+    await websocket.accept()
+    
+    step_bytes = int(_STREAM_STEP_SECONDS * SAMPLE_RATE) * 2  # int16 samples
+    pending_bytes = 0
+    
+    try:
+        # Loading the model (first use only) is slow and blocking
+        whisper_service = await asyncio.to_thread(get_whisper_service)
+        transcriber = StreamingTranscriber(whisper_service, language=language)
+        
+        while True:
+            message = await websocket.receive()
+            
+            if message["type"] == "websocket.disconnect":
+                return
+            
+            if message.get("bytes"):
+                transcriber.insert_audio(message["bytes"])
+                pending_bytes += len(message["bytes"])
+            elif message.get("text") == "end":
+                break
+            
+            # Frames that arrive while a round runs queue up in the socket,
+            # so under load the next round simply covers more new audio
+            if pending_bytes >= step_bytes:
+                pending_bytes = 0
+                words = await asyncio.to_thread(transcriber.process)
+                if words:
+                    await websocket.send_json({"type": "words", "words": _words_payload(words)})
+        
+        # End of stream: one last round, then confirm what's left
+        words = await asyncio.to_thread(transcriber.process)
+        words += transcriber.finish()
+        if words:
+            await websocket.send_json({"type": "words", "words": _words_payload(words)})
+        
+        await websocket.send_json({"type": "final", "text": transcriber.text})
+        await websocket.close()
+        
+    except WebSocketDisconnect:
+        logger.info("Audio stream client disconnected")
+    
+    except Exception as e:
+        logger.error(f"Audio stream failed: {e}")
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1011)
 
 
 # =============================================================================
 # MEETING MANAGEMENT ENDPOINTS
 # =============================================================================
 
+# Meetings per orjson.dumps() call when streaming the meeting list
+_LIST_BATCH_SIZE = 256
+
+
+def _iter_meeting_list_json(entries: list) -> Iterator[bytes]:
+    """
+    Encode the meeting list as a JSON array, one batch of meetings at a time.
+    
+    Only one batch of response dicts exists at any moment, instead of one
+    dict per meeting for the whole list before encoding starts.
+    """
+    yield b"["
+    for start in range(0, len(entries), _LIST_BATCH_SIZE):
+        if start:
+            yield b","
+        # [1:-1] drops the batch's own brackets, leaving comma-separated items
+        yield orjson.dumps([
+            {
+                "id": meeting_id,
+                "title": title,
+                "participants": participants,
+                "has_analysis": has_analysis,  # Has been analyzed?
+            }
+            for meeting_id, (title, participants, has_analysis)
+            in entries[start:start + _LIST_BATCH_SIZE]
+        ])[1:-1]
+    yield b"]"
+
+
 @router.get("/meetings")
 async def list_meetings():
     """
@@ -317,15 +573,13 @@ async def list_meetings():
     Returns basic metadata for each meeting (not full transcripts).
     Useful for populating a meeting list in the UI.
     """
-    return [
-        {
-            "id": m.id,
-            "title": m.title,
-            "participants": m.participants,
-            "has_analysis": m.summary is not None,  # Has been analyzed?
-        }
-        for m in meetings_db.values()
-    ]
+    # index() is a snapshot, so uploads or deletes made while the
+    # response is streaming can't change it mid-iteration
+    entries = await asyncio.to_thread(get_meeting_store().index)
+    return StreamingResponse(
+        _iter_meeting_list_json(entries),
+        media_type="application/json",
+    )
 
 
 @router.get("/meetings/{meeting_id}")
@@ -335,12 +589,15 @@ async def get_meeting(meeting_id: str):
     
     Includes the complete transcript and any analysis results.
     """
-    meeting = meetings_db.get(meeting_id)
+    # The stored row is already the meeting's JSON, so it is sent as-is
+    # without loading or re-serializing the Meeting object. Store calls
+    # hit SQLite, so they run in a worker thread like the uploads do.
+    body = await asyncio.to_thread(get_meeting_store().get_json, meeting_id)
     
-    if not meeting:
+    if body is None:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
-    return meeting.model_dump()
+    return Response(content=body, media_type="application/json")
 
 
 @router.delete("/meetings/{meeting_id}")
@@ -349,30 +606,56 @@ async def delete_meeting(meeting_id: str):
     Delete a meeting and its vector store data.
     
     This removes:
-    1. The meeting from our in-memory database
+    1. The meeting from the meeting store
     2. All embedded chunks from ChromaDB
     """
-    if meeting_id not in meetings_db:
+    if not await asyncio.to_thread(_delete_meeting, meeting_id):
         raise HTTPException(status_code=404, detail="Meeting not found")
     
+    logger.info(f"Deleted meeting: {meeting_id}")
+    
+    return {"status": "deleted", "meeting_id": meeting_id}
+
+
+def _delete_meeting(meeting_id: str) -> bool:
+    """Delete a meeting and its vector store data (blocking). False if not found."""
+    store = get_meeting_store()
+    if meeting_id not in store:
+        return False
+    
     # Remove from vector store first
     vector_store = get_chroma_store()
     vector_store.delete_meeting(meeting_id)
     
     # Remove from our database
-    del meetings_db[meeting_id]
-    
-    logger.info(f"Deleted meeting: {meeting_id}")
-    
-    return {"status": "deleted", "meeting_id": meeting_id}
+    return store.delete(meeting_id)
 
 
 # =============================================================================
 # AI ANALYSIS ENDPOINTS
 # =============================================================================
 
+def _analysis_response(meeting: Meeting, cached: bool) -> ORJSONResponse:
+    """Build the analyze endpoint's response from a meeting's stored analysis."""
+    # Decisions and action items are flat string models, so after one
+    # model_dump() each the payload is plain JSON data. Returning the
+    # response directly skips FastAPI's jsonable_encoder, which would
+    # walk every dumped dict again before encoding.
+    # X-Cache mirrors "cached" so proxies/logs can track the hit rate.
+    return ORJSONResponse({
+        "meeting_id": meeting.id,
+        "summary": {
+            "overview": meeting.summary,
+            "key_topics": meeting.key_topics,
+            "decisions": [d.model_dump() for d in meeting.decisions],
+            "action_items": [a.model_dump() for a in meeting.action_items],
+        },
+        "cached": cached,
+    }, headers={"X-Cache": "hit" if cached else "miss"})
+
+
 @router.post("/meetings/{meeting_id}/analyze")
-async def analyze_meeting(meeting_id: str):
+async def analyze_meeting(meeting_id: str, force: bool = False):
     """
     Run AI analysis on a meeting transcript.
     
@@ -385,7 +668,9 @@ async def analyze_meeting(meeting_id: str):
     IMPORTANT:
         - This makes multiple LLM API calls (costs $)
         - May take 10-30 seconds depending on transcript length
-        - Results are cached in the meeting object
+        - Results are cached in the meeting object: an already analyzed
+          meeting returns its stored results unless ?force=true is passed
+          (which also skips the cached LLM results of earlier runs)
     
     RESPONSE:
         {
@@ -395,21 +680,29 @@ async def analyze_meeting(meeting_id: str):
                 "key_topics": ["Budget", "Timeline", "Resources"],
                 "decisions": [...],
                 "action_items": [...]
-            }
+            },
+            "cached": false
         }
     """
-    meeting = meetings_db.get(meeting_id)
+    meeting = await asyncio.to_thread(get_meeting_store().get, meeting_id)
     
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
+    # A repeat POST (double click, retry, page reload) returns the stored
+    # analysis instead of paying for the whole pipeline again
+    if meeting.summary is not None and not force:
+        logger.info(f"Returning stored analysis for {meeting_id}")
+        return _analysis_response(meeting, cached=True)
+    
     try:
-        # Create analyzer and run the LangGraph pipeline
-        analyzer = MeetingAnalyzer()
+        # Get the shared analyzer and run the LangGraph pipeline
+        analyzer = get_meeting_analyzer()
         result = await analyzer.analyze(
             meeting_id=meeting_id,
             meeting_title=meeting.title,
-            raw_transcript=meeting.raw_transcript,
+            raw_transcript=meeting.transcript_text(),
+            force=force,
         )
         
         # Update meeting with analysis results
@@ -419,19 +712,19 @@ async def analyze_meeting(meeting_id: str):
         meeting.decisions = result.get("decisions", [])
         meeting.action_items = result.get("action_items", [])
         
-        return {
-            "meeting_id": meeting_id,
-            "summary": {
-                "overview": meeting.summary,
-                "key_topics": meeting.key_topics,
-                "decisions": [d.model_dump() for d in meeting.decisions],
-                "action_items": [a.model_dump() for a in meeting.action_items],
-            },
-        }
-        
+        # update(), not save(): if the meeting was deleted while the
+        # pipeline ran, it must stay deleted
+        stored = await asyncio.to_thread(get_meeting_store().update, meeting)
+    
     except Exception as e:
         logger.error(f"Analysis failed for {meeting_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    if not stored:
+        logger.info(f"Meeting {meeting_id} was deleted during analysis")
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    return _analysis_response(meeting, cached=False)
 
 
 @router.post("/meetings/{meeting_id}/ask")
@@ -456,7 +749,10 @@ async def ask_question(meeting_id: str, request: QuestionRequest):
             "sources": ["[00:15] Alice: I think we need more time..."]
         }
     """
-    if meeting_id not in meetings_db:
+    # The membership check is an in-memory lookup; only the accessor can
+    # block (it opens the database if start-up warm-up failed)
+    store = await asyncio.to_thread(get_meeting_store)
+    if meeting_id not in store:
         raise HTTPException(status_code=404, detail="Meeting not found")
     
     try:
@@ -471,7 +767,7 @@ async def ask_question(meeting_id: str, request: QuestionRequest):
             "answer": result["answer"],
             "sources": result.get("sources", []),
         }
-        
+    
     except Exception as e:
         logger.error(f"Q&A failed for {meeting_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -47,7 +47,7 @@ OPTIONAL (have defaults):
 
 import logging
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -109,6 +109,61 @@ class Settings(BaseSettings):
         ),
     )
     
+    embedding_backend: Literal["openai", "local"] = Field(
+        default="openai",
+        description=(
+            "Where embeddings are computed. local runs local_embedding_model "
+            "in-process (needs the local-embeddings extra); openai calls the API."
+        ),
+    )
+    
+    local_embedding_model: str = Field(
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        description="sentence-transformers model used when embedding_backend is local",
+    )
+    
+    local_embedding_device: Optional[str] = Field(
+        default=None,
+        description="Device for the local embedding model (cpu, cuda). None = auto-detect",
+    )
+    
+    embedding_cache_path: str = Field(
+        default="./data/embedding_cache.db",
+        description=(
+            "SQLite file caching document embeddings by text hash, so re-uploaded "
+            "transcripts only embed new or changed chunks. Empty disables the cache."
+        ),
+    )
+    
+    embedding_batch_size: int = Field(
+        default=256,
+        description="Texts per embeddings API request when indexing a meeting",
+    )
+    
+    embedding_max_concurrency: int = Field(
+        default=4,
+        description=(
+            "Embeddings API requests in flight at once while indexing a meeting. "
+            "1 sends batches one after another."
+        ),
+    )
+    
+    prompt_max_tokens: int = Field(
+        default=4000,
+        description=(
+            "Maximum transcript tokens sent in one analysis prompt. "
+            "Transcripts are cut at a token boundary to stay within this budget."
+        ),
+    )
+    
+    llm_max_concurrency: int = Field(
+        default=8,
+        description=(
+            "Maximum LLM requests in flight at once (across all analyses). "
+            "Match this to your OpenAI rate limit tier."
+        ),
+    )
+    
     # =========================================================================
     # Whisper Settings (Local Voice-to-Text)
     # =========================================================================
@@ -122,6 +177,70 @@ class Settings(BaseSettings):
         ),
     )
     
+    whisper_download_root: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directory Whisper models are downloaded to and loaded from. "
+            "None = the Hugging Face cache. The Docker image pre-fills /models/whisper."
+        ),
+    )
+    
+    whisper_preload: bool = Field(
+        default=True,
+        description=(
+            "Load the Whisper model at startup instead of on the first audio "
+            "upload. Startup takes longer; disable if audio isn't used."
+        ),
+    )
+    
+    whisper_device: str = Field(
+        default="cpu",
+        description=(
+            "Device for Whisper inference: cpu, cuda, or auto (cuda if available). "
+            "cpu keeps the Docker image GPU-free."
+        ),
+    )
+    
+    whisper_compute_type: str = Field(
+        default="int8",
+        description=(
+            "CTranslate2 compute type: int8 (CPU default; becomes int8_float16 "
+            "on a GPU), float16, or default to let CTranslate2 choose"
+        ),
+    )
+    
+    whisper_num_workers: int = Field(
+        default=2,
+        description=(
+            "Transcriptions that run in parallel (requests beyond this wait "
+            "their turn). Each one adds activation memory, not another model copy."
+        ),
+    )
+    
+    whisper_cpu_threads: int = Field(
+        default=0,
+        description=(
+            "CPU threads per Whisper worker. 0 = split all cores evenly "
+            "across whisper_num_workers."
+        ),
+    )
+    
+    whisper_beam_size: int = Field(
+        default=5,
+        description=(
+            "Beam search width. 1 (greedy) decodes about twice as fast "
+            "with slightly lower accuracy."
+        ),
+    )
+    
+    whisper_batch_size: int = Field(
+        default=8,
+        description=(
+            "Audio windows decoded together per Whisper forward pass. "
+            "Higher = faster on long recordings, more memory. 1 disables batching."
+        ),
+    )
+    
     # =========================================================================
     # Vector Store Settings (ChromaDB)
     # =========================================================================
@@ -136,6 +255,21 @@ class Settings(BaseSettings):
         description="Directory for ChromaDB persistence (not used in current in-memory mode)",
     )
     
+    # =========================================================================
+    # Meeting Storage Settings
+    # =========================================================================
+    # Meetings are persisted in SQLite; only recently used ones stay in memory
+    
+    meeting_db_path: str = Field(
+        default="./data/meetings.db",
+        description="SQLite file for stored meetings (\":memory:\" keeps nothing on disk)",
+    )
+    
+    meeting_cache_max_entries: int = Field(
+        default=128,
+        description="Maximum number of full Meeting objects kept in memory",
+    )
+    
     # =========================================================================
     # Text Chunking Settings (for RAG)
     # =========================================================================
@@ -157,6 +291,59 @@ class Settings(BaseSettings):
         ),
     )
     
+    # =========================================================================
+    # Analysis Cache Settings
+    # =========================================================================
+    # Repeated analysis of the same transcript reuses cached LLM extraction
+    
+    analysis_cache_max_entries: int = Field(
+        default=256,
+        description="Maximum number of cached extraction results. 0 disables the cache.",
+    )
+    
+    analysis_cache_ttl_seconds: int = Field(
+        default=86400,
+        description="How long a cached extraction result stays valid (default: 24h)",
+    )
+    
+    semantic_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Reuse extraction results for NEAR-duplicate transcripts (by embedding "
+            "similarity). Costs one embedding call per analysis; off by default."
+        ),
+    )
+    
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        description="Minimum cosine similarity for a semantic cache hit",
+    )
+    
+    semantic_cache_ttl_seconds: int = Field(
+        default=3600,
+        description="How long a semantic cache entry stays valid (default: 1h)",
+    )
+    
+    retrieval_cache_max_entries: int = Field(
+        default=256,
+        description="Maximum number of cached Q&A retrievals. 0 disables the cache.",
+    )
+    
+    retrieval_cache_ttl_seconds: int = Field(
+        default=600,
+        description="How long a cached Q&A retrieval stays valid (default: 10m)",
+    )
+    
+    answer_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum number of cached Q&A answers. 0 disables the cache.",
+    )
+    
+    answer_cache_ttl_seconds: int = Field(
+        default=600,
+        description="How long a cached Q&A answer stays valid (default: 10m)",
+    )
+    
     # =========================================================================
     # Application Settings
     # =========================================================================
@@ -171,6 +358,14 @@ class Settings(BaseSettings):
         description="Port for backend API server",
     )
     
+    threadpool_size: int = Field(
+        default=64,
+        description=(
+            "Worker threads for blocking work (parsing, SQLite, embedding, "
+            "transcription). Long transcriptions hold a thread while queued."
+        ),
+    )
+    
     ui_host: str = Field(
         default="0.0.0.0",
         description="Host to bind UI server",
@@ -10,9 +10,11 @@ APPLICATION STARTUP FLOW:
 
     1. Python loads this module
     2. FastAPI app is created with metadata
-    3. CORS middleware is configured
+    3. CORS, GZip and timing middleware are configured
     4. API routes are registered
     5. Uvicorn starts the server (when run via `uvicorn src.main:app`)
+    6. lifespan() warms up the shared services, then requests are served
+       (stored meetings are re-indexed for Q&A in the background)
 
 =============================================================================
 KEY COMPONENTS:
@@ -28,6 +30,10 @@ CORS Middleware:
     - Allows frontend to make requests to backend
     - Required for Streamlit UI running on different port
 
+GZip Middleware:
+    - Compresses JSON responses over 1 KB for clients that accept gzip
+    - Meeting lists, transcripts and analyses shrink several times over
+
 Router:
     - API routes defined in src/api/routes.py
     - All routes prefixed with /api/v1
@@ -40,20 +46,31 @@ Development:
     uvicorn src.main:app --reload --port 8001
 
 Production (Docker):
-    uvicorn src.main:app --host 0.0.0.0 --port 8001
+    uvicorn src.main:app --host 0.0.0.0 --port 8001 --loop uvloop --http httptools
 
 =============================================================================
 """
 
+import asyncio
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import our API routes
-from .api.routes import router
+from .agents import get_meeting_analyzer, get_qa_agent
+from .api import RequestTimingMiddleware, router
 from .config import get_settings
+from .models import Meeting
+from .services import get_whisper_service
+from .storage import get_meeting_store
+from .vectorstore import get_chroma_store
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -72,6 +89,146 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# LIFECYCLE (LIFESPAN)
+# =============================================================================
+# Code before `yield` runs at application startup, code after it at
+# shutdown. Useful for initializing/cleaning up resources.
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run startup work before serving requests, and cleanup on shutdown.
+    
+    Startup:
+    - Validate configuration
+    - Create the shared services (and optionally load Whisper) so the
+      first real request doesn't pay for it
+    """
+    logger.info("🚀 Starting Meeting Intelligence API...")
+    
+    # Load settings to validate configuration early
+    settings = get_settings()
+    
+    # Log configuration (hide sensitive values)
+    logger.info(f"Configuration loaded:")
+    logger.info(f"  - OpenAI Model: {settings.openai_model}")
+    logger.info(f"  - Embedding Model: {settings.openai_embedding_model}")
+    logger.info(f"  - Whisper Model: {settings.whisper_model}")
+    logger.info(f"  - Log Level: {settings.log_level}")
+    
+    # Verify OpenAI API key is set
+    api_key_set = settings.openai_api_key not in ("", "your_openai_api_key_here")
+    if not api_key_set:
+        logger.warning("⚠️ OPENAI_API_KEY is not set! LLM features will not work.")
+    else:
+        logger.info("  - OpenAI API Key: ****" + settings.openai_api_key[-4:])
+    
+    # Blocking work goes to worker threads: asyncio.to_thread (routes) uses
+    # the loop's default executor, FastAPI's own helpers (e.g. UploadFile
+    # reads) use anyio's pool. The defaults (min(32, cores + 4) and 40) are
+    # easily filled by a few queued audio uploads, which would stall
+    # transcript uploads and Q&A behind them.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.threadpool_size)
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    
+    # Model loading and client setup block, so they run in a worker
+    # thread; the server starts accepting requests once they're done
+    await asyncio.to_thread(_warm_up_services, api_key_set, settings.whisper_preload)
+    
+    # Re-indexing takes time proportional to the number of stored
+    # meetings, so it runs in the background instead of delaying startup.
+    # Keeping a reference on app.state stops it being garbage-collected.
+    if api_key_set:
+        app.state.restore_task = asyncio.create_task(asyncio.to_thread(_restore_vector_index))
+    
+    logger.info("✅ Meeting Intelligence API started successfully")
+    
+    yield
+    
+    logger.info("👋 Shutting down Meeting Intelligence API...")
+
+
+def _warm_up_services(api_key_set: bool, preload_whisper: bool) -> None:
+    """
+    Create the shared service singletons before the first request.
+    
+    Routes fetch these through their get_*() accessors, which are cheap
+    once the instance exists; building them here moves the database,
+    client and graph setup out of the first request's latency.
+    
+    With preload_whisper, the Whisper model is also loaded and run once
+    on silence, so the first audio upload doesn't wait for the model
+    download/load either. Failures are not fatal: the accessors retry
+    on first use.
+    """
+    try:
+        get_meeting_store()
+        if api_key_set:
+            get_chroma_store()
+            get_meeting_analyzer()
+            get_qa_agent()
+        logger.info("  - Services warmed up")
+    except Exception as e:
+        logger.warning(f"⚠️ Service warm-up failed: {e}")
+    
+    if preload_whisper:
+        try:
+            get_whisper_service().warm_up()
+            logger.info("  - Whisper model loaded")
+        except Exception as e:
+            logger.warning(f"⚠️ Whisper warm-up failed: {e}")
+
+
+def _restore_vector_index() -> None:
+    """
+    Re-add stored meetings to the vector store.
+    
+    Meetings persist in SQLite but ChromaDB runs in memory, so after a
+    restart Q&A would find nothing. Re-indexing is cheap when the embedding
+    cache is enabled: unchanged texts get their vectors from the cache, not
+    the API. Without the cache every meeting would be re-embedded, so the
+    vector store is left empty instead (as before).
+    
+    Runs in a worker thread after startup. A meeting that fails to load or
+    embed is logged and skipped, so the rest are still restored.
+    """
+    if not get_settings().embedding_cache_path:
+        return
+    
+    try:
+        meetings = get_meeting_store()
+        vector_store = get_chroma_store()
+    except Exception as e:
+        logger.warning(f"⚠️ Vector index restore skipped: {e}")
+        return
+    
+    # Built from the stored JSON directly, so the hot cache isn't filled
+    # with (and flushed of) every meeting on startup
+    restored = failed = 0
+    for meeting_id, _ in meetings.index():
+        try:
+            data = meetings.get_json(meeting_id)
+            if data is None:
+                continue
+            
+            vector_store.add_meeting(Meeting.model_validate_json(data))
+            restored += 1
+            
+            # Requests are served meanwhile; drop the chunks again if the
+            # meeting was deleted while it was being embedded
+            if meeting_id not in meetings:
+                vector_store.delete_meeting(meeting_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not restore meeting {meeting_id} to the vector store: {e}")
+            failed += 1
+    
+    if restored or failed:
+        logger.info(f"  - Restored {restored} meetings to the vector store ({failed} failed)")
+
+
 # =============================================================================
 # CREATE FASTAPI APPLICATION
 # =============================================================================
@@ -90,6 +247,12 @@ app = FastAPI(
     docs_url="/docs",           # Swagger UI at /docs
     redoc_url="/redoc",         # ReDoc at /redoc
     openapi_url="/openapi.json",
+    # Encode every JSON response with orjson (C) instead of stdlib json.
+    # Routes returning dicts (e.g. thousands of transcription segments)
+    # are still made JSON-safe by FastAPI first, but the final encoding
+    # pass is several times faster.
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
@@ -116,6 +279,34 @@ app.add_middleware(
 )
 
 
+# =============================================================================
+# GZIP COMPRESSION MIDDLEWARE
+# =============================================================================
+# Meeting lists, full transcripts and analyses are tens to hundreds of KB
+# of repetitive JSON, which gzip shrinks several times over. Small bodies
+# (health checks, errors) are sent as-is, since compressing them costs more
+# than it saves. Responses only get compressed when the client sends
+# Accept-Encoding: gzip, and they carry Vary: Accept-Encoding for caches.
+#
+# Level 5 keeps most of level 9's ratio on JSON at a fraction of the CPU.
+# Added after CORS so it wraps it: CORS headers are set first, then the
+# final body is compressed.
+
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# =============================================================================
+# REQUEST TIMING MIDDLEWARE
+# =============================================================================
+# Adds X-Response-Time to every response. Added last so it is the
+# outermost layer and its time includes CORS and compression.
+#
+# NOTE: Middleware here is pure ASGI (see src/api/middleware.py); don't
+# add BaseHTTPMiddleware or @app.middleware("http") functions.
+
+app.add_middleware(RequestTimingMiddleware)
+
+
 # =============================================================================
 # REGISTER API ROUTES
 # =============================================================================
@@ -129,56 +320,6 @@ app.include_router(
 )
 
 
-# =============================================================================
-# LIFECYCLE EVENTS
-# =============================================================================
-# These hooks run at application startup and shutdown.
-# Useful for initializing/cleaning up resources.
-
-@app.on_event("startup")
-async def startup_event():
-    """
-    Called when the application starts.
-    
-    Use this to:
-    - Initialize database connections
-    - Load ML models (Whisper, embeddings)
-    - Validate configuration
-    """
-    logger.info("🚀 Starting Meeting Intelligence API...")
-    
-    # Load settings to validate configuration early
-    settings = get_settings()
-    
-    # Log configuration (hide sensitive values)
-    logger.info(f"Configuration loaded:")
-    logger.info(f"  - OpenAI Model: {settings.openai_model}")
-    logger.info(f"  - Embedding Model: {settings.openai_embedding_model}")
-    logger.info(f"  - Whisper Model: {settings.whisper_model}")
-    logger.info(f"  - Log Level: {settings.log_level}")
-    
-    # Verify OpenAI API key is set
-    if not settings.openai_api_key or settings.openai_api_key == "your_openai_api_key_here":
-        logger.warning("⚠️ OPENAI_API_KEY is not set! LLM features will not work.")
-    else:
-        logger.info("  - OpenAI API Key: ****" + settings.openai_api_key[-4:])
-    
-    logger.info("✅ Meeting Intelligence API started successfully")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Called when the application shuts down.
-    
-    Use this to:
-    - Close database connections
-    - Save state
-    - Clean up resources
-    """
-    logger.info("👋 Shutting down Meeting Intelligence API...")
-
-
 # =============================================================================
 # HEALTH CHECK (Root Endpoint)
 # =============================================================================
@@ -196,7 +196,7 @@ class Meeting(BaseModel):
     # =========================================================================
     
     id: str = Field(
-        description="Unique identifier (UUID format)"
+        description="Unique identifier (32 hex chars, time-ordered)"
     )
     
     title: str = Field(
@@ -214,7 +214,10 @@ class Meeting(BaseModel):
     
     raw_transcript: Optional[str] = Field(
         default=None,
-        description="Original unprocessed transcript text"
+        description=(
+            "Original unprocessed transcript text. None for audio meetings, "
+            "whose text is rendered from segments (see transcript_text())"
+        ),
     )
     
     segments: list[TranscriptSegment] = Field(
@@ -250,6 +253,20 @@ class Meeting(BaseModel):
         default_factory=list,
         description="Action items with owners and deadlines"
     )
+    
+    def transcript_text(self) -> str:
+        """
+        Get the transcript as text.
+        
+        Returns raw_transcript if set. Audio meetings don't store one (it
+        would just repeat the segments), so it is rendered from segments
+        in the normalized "[timestamp] Speaker: text" format instead.
+        """
+        if self.raw_transcript is not None:
+            return self.raw_transcript
+        return "\n".join(
+            f"[{seg.timestamp}] {seg.speaker}: {seg.text}" for seg in self.segments
+        )
 
 
 # =============================================================================
@@ -2,11 +2,12 @@
 
 from .embedding_service import EmbeddingService, get_embedding_service
 from .llm_service import LLMService, get_llm_service
-from .whisper_service import WhisperService, get_whisper_service
+from .whisper_service import StreamingTranscriber, WhisperService, get_whisper_service
 
 __all__ = [
     "EmbeddingService",
     "LLMService",
+    "StreamingTranscriber",
     "WhisperService",
     "get_embedding_service",
     "get_llm_service",
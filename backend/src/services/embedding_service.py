@@ -2,18 +2,218 @@
 Embedding Service for AI Meeting Intelligence System
 
 This service provides text embedding functionality using OpenAI's
-embedding models for semantic search and retrieval.
+embedding models (or, optionally, a local sentence-transformers model)
+for semantic search and retrieval.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+import httpx
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_HTTP_CLIENT_OPTIONS = {
+    "limits": httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    "timeout": httpx.Timeout(600.0, connect=5.0),  # Same as the OpenAI SDK default
+}
+
+
+class ConcurrentEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that sends large document lists as parallel requests.
+    
+    OpenAIEmbeddings splits a long list into batches but sends them one
+    after another, so indexing a long meeting costs one round-trip per
+    batch. Here the batches are in flight together (at most
+    `max_concurrency` at once), so it costs about one round-trip per
+    `max_concurrency` batches.
+    """
+    
+    def __init__(self, underlying: Embeddings, batch_size: int, max_concurrency: int) -> None:
+        self.underlying = underlying
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="embed",
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        batches = self._batches(texts)
+        if len(batches) <= 1:
+            return self.underlying.embed_documents(texts)
+        
+        # map() keeps batch order, so vectors line up with texts
+        results = self._executor.map(self.underlying.embed_documents, batches)
+        return [vector for batch in results for vector in batch]
+    
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        batches = self._batches(texts)
+        if len(batches) <= 1:
+            return await self.underlying.aembed_documents(texts)
+        
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def embed_batch(batch: list[str]) -> list[list[float]]:
+            async with self._semaphore:
+                return await self.underlying.aembed_documents(batch)
+        
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return [vector for batch in results for vector in batch]
+    
+    def embed_query(self, text: str) -> list[float]:
+        return self.underlying.embed_query(text)
+    
+    async def aembed_query(self, text: str) -> list[float]:
+        return await self.underlying.aembed_query(text)
+    
+    def _batches(self, texts: list[str]) -> list[list[str]]:
+        return [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that only sends texts it hasn't embedded before.
+    
+    Re-uploading an edited transcript produces mostly identical segments
+    and chunks. Document vectors are stored in SQLite keyed by a hash of
+    (model, text), so only new or changed texts are sent to the API, in a
+    single batch. The cache survives restarts.
+    
+    Queries (embed_query(), used by Chroma searches) are mostly one-off,
+    so they stay out of SQLite. Repeats are common though (the same
+    question asked of several meetings, suggested questions in the UI),
+    so the most recent ones are kept in a small in-memory LRU.
+    """
+    
+    # Keys per SELECT ... IN (...), below SQLite's bound-parameter limit
+    _LOOKUP_BATCH = 500
+    
+    # Recent query vectors kept in memory (1536 floats each for OpenAI)
+    _QUERY_CACHE_SIZE = 1024
+    
+    def __init__(self, underlying: Embeddings, path: str, namespace: str) -> None:
+        self.underlying = underlying
+        self.namespace = namespace
+        
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        
+        self._queries: OrderedDict[str, list[float]] = OrderedDict()
+    
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors, missing = self._lookup(texts)
+        if missing:
+            new_vectors = self.underlying.embed_documents(list(missing.values()))
+            self._store(missing, new_vectors, vectors)
+        return [vectors[key] for key in keys]
+    
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors, missing = self._lookup(texts)
+        if missing:
+            new_vectors = await self.underlying.aembed_documents(list(missing.values()))
+            self._store(missing, new_vectors, vectors)
+        return [vectors[key] for key in keys]
+    
+    def embed_query(self, text: str) -> list[float]:
+        vector = self._cached_query(text)
+        if vector is None:
+            vector = self.underlying.embed_query(text)
+            self._remember_query(text, vector)
+        return vector
+    
+    async def aembed_query(self, text: str) -> list[float]:
+        vector = self._cached_query(text)
+        if vector is None:
+            vector = await self.underlying.aembed_query(text)
+            self._remember_query(text, vector)
+        return vector
+    
+    def _cached_query(self, text: str) -> Optional[list[float]]:
+        with self._lock:
+            vector = self._queries.get(text)
+            if vector is not None:
+                self._queries.move_to_end(text)
+            return vector
+    
+    def _remember_query(self, text: str, vector: list[float]) -> None:
+        with self._lock:
+            self._queries[text] = vector
+            if len(self._queries) > self._QUERY_CACHE_SIZE:
+                self._queries.popitem(last=False)
+    
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode()).digest()
+    
+    def _lookup(
+        self, texts: list[str]
+    ) -> tuple[list[bytes], dict[bytes, list[float]], dict[bytes, str]]:
+        """
+        Find cached vectors.
+        
+        Returns:
+            (key per text, cached vectors by key, uncached texts by key)
+        """
+        keys = [self._key(text) for text in texts]
+        unique = list(dict.fromkeys(keys))
+        
+        vectors: dict[bytes, list[float]] = {}
+        with self._lock:
+            for start in range(0, len(unique), self._LOOKUP_BATCH):
+                batch = unique[start:start + self._LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                )
+                for key, blob in rows:
+                    vectors[key] = array("f", blob).tolist()
+        
+        # Duplicates within the batch are embedded once
+        missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        
+        if texts:
+            logger.info(f"Embedding cache: {len(texts) - len(missing)}/{len(texts)} hits")
+        return keys, vectors, missing
+    
+    def _store(
+        self,
+        missing: dict[bytes, str],
+        new_vectors: list[list[float]],
+        vectors: dict[bytes, list[float]],
+    ) -> None:
+        """Save freshly embedded vectors and add them to `vectors`."""
+        # OpenAI returns float32 values, so storing them as float32 is lossless
+        rows = [(key, array("f", vector).tobytes()) for key, vector in zip(missing, new_vectors)]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+            self._conn.commit()
+        vectors.update(zip(missing, new_vectors))
+
 
 class EmbeddingService:
     """
@@ -23,12 +223,14 @@ class EmbeddingService:
     representations for semantic search.
     
     Attributes:
-        embeddings: The OpenAIEmbeddings instance
+        embeddings: The OpenAIEmbeddings (or local model) instance, wrapped
+                    in ConcurrentEmbeddings (OpenAI only) and CachedEmbeddings
+                    unless those are disabled
         model_name: Name of the embedding model being used
     """
     
     _instance: Optional["EmbeddingService"] = None
-    _embeddings: Optional[OpenAIEmbeddings] = None
+    _embeddings: Optional[Embeddings] = None
     
     def __new__(cls) -> "EmbeddingService":
         """Singleton pattern to reuse embeddings instance."""
@@ -37,23 +239,77 @@ class EmbeddingService:
         return cls._instance
     
     def __init__(self) -> None:
-        """Initialize the embedding service with OpenAI."""
+        """Initialize the embedding service (OpenAI or a local model)."""
         if self._embeddings is None:
             settings = get_settings()
-            self.model_name = settings.openai_embedding_model
             
-            logger.info(f"Initializing embeddings with model: {self.model_name}")
+            if settings.embedding_backend == "local":
+                self.model_name = settings.local_embedding_model
+                logger.info(f"Initializing local embeddings with model: {self.model_name}")
+                self._embeddings = self._create_local_embeddings(settings)
+            else:
+                self.model_name = settings.openai_embedding_model
+                logger.info(f"Initializing embeddings with model: {self.model_name}")
+                # Long-lived HTTP/2 clients, as in LLMService: indexing and
+                # searches reuse warm connections, and parallel batches are
+                # multiplexed over them. Chroma calls the sync client.
+                self._embeddings = OpenAIEmbeddings(
+                    model=self.model_name,
+                    api_key=settings.openai_api_key,
+                    http_client=httpx.Client(http2=True, **_HTTP_CLIENT_OPTIONS),
+                    http_async_client=httpx.AsyncClient(http2=True, **_HTTP_CLIENT_OPTIONS),
+                )
+                
+                # The local model already batches on-device; API calls
+                # are network-bound, so their batches are overlapped
+                if settings.embedding_max_concurrency > 1:
+                    self._embeddings = ConcurrentEmbeddings(
+                        self._embeddings,
+                        batch_size=settings.embedding_batch_size,
+                        max_concurrency=settings.embedding_max_concurrency,
+                    )
             
-            self._embeddings = OpenAIEmbeddings(
-                model=self.model_name,
-                api_key=settings.openai_api_key,
-            )
+            # Reuse vectors for texts embedded before (e.g. re-uploads)
+            if settings.embedding_cache_path:
+                self._embeddings = CachedEmbeddings(
+                    self._embeddings,
+                    path=settings.embedding_cache_path,
+                    namespace=self.model_name,
+                )
             
             logger.info("Embedding service initialized successfully")
     
+    @staticmethod
+    def _create_local_embeddings(settings) -> Embeddings:
+        """
+        Create a sentence-transformers model that runs in-process.
+        
+        No network round-trip per call, and add_meeting's texts are encoded
+        in batches on the local CPU/GPU. Requires the optional
+        "local-embeddings" dependencies.
+        """
+        try:
+            from langchain_huggingface import HuggingFaceEmbeddings
+        except ImportError as e:
+            raise RuntimeError(
+                "EMBEDDING_BACKEND=local needs the optional dependencies: "
+                "pip install -e '.[local-embeddings]'"
+            ) from e
+        
+        # sentence-transformers picks CUDA automatically when available
+        model_kwargs = {}
+        if settings.local_embedding_device:
+            model_kwargs["device"] = settings.local_embedding_device
+        
+        return HuggingFaceEmbeddings(
+            model_name=settings.local_embedding_model,
+            model_kwargs=model_kwargs,
+            encode_kwargs={"batch_size": 64, "normalize_embeddings": True},
+        )
+    
     @property
-    def embeddings(self) -> OpenAIEmbeddings:
-        """Get the OpenAIEmbeddings instance."""
+    def embeddings(self) -> Embeddings:
+        """Get the embeddings instance (possibly cache-wrapped)."""
         if self._embeddings is None:
             raise RuntimeError("Embeddings not initialized")
         return self._embeddings
@@ -5,11 +5,15 @@ This service provides a unified interface to OpenAI's language models
 for chat completions and structured output generation.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Optional, TypeVar
 
+import httpx
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel
 
@@ -49,14 +53,41 @@ class LLMService:
             
             logger.info(f"Initializing LLM with model: {self.model_name}")
             
+            # Caps in-flight LLM requests across ALL callers so concurrent
+            # analyses don't blow through provider rate limits (429s)
+            self._semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+            
+            # Per-call variants of the LLM (structured output per schema,
+            # JSON mode / temperature overrides) are built once and reused:
+            # with_structured_output() generates the schema's JSON schema and
+            # tool binding every time it is called
+            self._variants: dict[tuple, Runnable] = {}
+            
             self._llm = ChatOpenAI(
                 model=self.model_name,
                 api_key=settings.openai_api_key,
                 temperature=0.1,  # Low temperature for consistent outputs
+                http_async_client=self._create_http_client(),
+                max_retries=3,  # SDK retries 429/5xx with exponential backoff
             )
             
             logger.info("LLM service initialized successfully")
     
+    @staticmethod
+    def _create_http_client() -> httpx.AsyncClient:
+        """
+        Create the shared HTTP client for OpenAI calls.
+        
+        One long-lived HTTP/2 client means every node's LLM call reuses
+        warm connections (no repeated TCP+TLS handshakes), and concurrent
+        calls are multiplexed over the same connection.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(600.0, connect=5.0),  # Same as the OpenAI SDK default
+        )
+    
     @property
     def llm(self) -> ChatOpenAI:
         """Get the ChatOpenAI instance."""
@@ -68,6 +99,7 @@ class LLMService:
         self,
         messages: list[BaseMessage],
         temperature: Optional[float] = None,
+        json_mode: bool = False,
     ) -> str:
         """
         Send messages to the LLM and get a response.
@@ -75,17 +107,87 @@ class LLMService:
         Args:
             messages: List of chat messages
             temperature: Optional temperature override
+            json_mode: Force the response to be a single JSON object
         
         Returns:
             The assistant's response text
         """
-        llm = self.llm
-        if temperature is not None:
-            llm = llm.with_config({"temperature": temperature})
+        llm = self._configure(temperature, json_mode)
         
-        response = await llm.ainvoke(messages)
+        async with self._semaphore:
+            response = await llm.ainvoke(messages)
+        self._log_usage(response)
         return response.content if isinstance(response.content, str) else str(response.content)
     
+    async def chat_stream(
+        self,
+        messages: list[BaseMessage],
+        temperature: Optional[float] = None,
+        json_mode: bool = False,
+    ) -> AsyncIterator[str]:
+        """
+        Send messages to the LLM and stream the response text.
+        
+        Lets callers parse output while it is still being generated and
+        stop early (closing the generator aborts the request).
+        
+        Args:
+            messages: List of chat messages
+            temperature: Optional temperature override
+            json_mode: Force the response to be a single JSON object
+        
+        Yields:
+            Chunks of the assistant's response text
+        """
+        llm = self._configure(temperature, json_mode)
+        
+        async with self._semaphore:
+            async for chunk in llm.astream(messages):
+                if isinstance(chunk.content, str) and chunk.content:
+                    yield chunk.content
+    
+    def _configure(self, temperature: Optional[float], json_mode: bool):
+        """
+        Apply per-call overrides to the shared LLM.
+        
+        json_mode uses OpenAI's JSON mode (response_format=json_object):
+        the model can only emit one valid JSON object, so no decode tokens
+        are spent on prose and parsing can't fail on framing text. The
+        prompt must mention JSON and ask for an object at the root.
+        """
+        if temperature is None and not json_mode:
+            return self.llm
+        
+        key = ("configured", temperature, json_mode)
+        llm = self._variants.get(key)
+        if llm is None:
+            llm = self.llm
+            if temperature is not None:
+                llm = llm.with_config({"temperature": temperature})
+            if json_mode:
+                llm = llm.bind(response_format={"type": "json_object"})
+            self._variants[key] = llm
+        return llm
+    
+    @staticmethod
+    def _log_usage(response: AIMessage) -> None:
+        """
+        Log token usage, including prompt-cache hits.
+        
+        OpenAI caches identical prompt prefixes automatically (1024+ tokens),
+        which is why prompts keep static instructions first and the transcript
+        last. cache_read shows how many input tokens were served from cache.
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if not usage:
+            return
+        
+        cached_tokens = (usage.get("input_token_details") or {}).get("cache_read", 0)
+        logger.debug(
+            f"LLM usage: {usage.get('input_tokens', 0)} input tokens "
+            f"({cached_tokens} cached), {usage.get('output_tokens', 0)} output tokens"
+        )
+    
     async def chat_with_prompt(
         self,
         prompt_template: str,
@@ -129,8 +231,12 @@ class LLMService:
         Returns:
             Instance of the output schema
         """
-        structured_llm = self.llm.with_structured_output(output_schema)
-        response = await structured_llm.ainvoke(messages)
+        key = ("structured", output_schema)
+        structured_llm = self._variants.get(key)
+        if structured_llm is None:
+            structured_llm = self._variants[key] = self.llm.with_structured_output(output_schema)
+        async with self._semaphore:
+            response = await structured_llm.ainvoke(messages)
         return response
     
     def create_messages(
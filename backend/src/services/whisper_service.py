@@ -5,16 +5,27 @@ This service uses faster-whisper (CTranslate2) for transcription.
 Runs locally with no API calls - completely free.
 """
 
+import io
 import logging
-import tempfile
+import os
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
-from faster_whisper import WhisperModel
+import ctranslate2
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
 
 from ..config import get_settings
 from ..models import TranscriptSegment
 
+# faster-whisper expects 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Shorter clips fit in one 30s window, where the batched pipeline's VAD
+# pass and batching setup cost more than they save
+_MIN_BATCHED_SECONDS = 5.0
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +43,7 @@ class WhisperService:
     
     _instance: Optional["WhisperService"] = None
     _model: Optional[WhisperModel] = None
+    _pipeline: Optional[BatchedInferencePipeline] = None
     
     def __new__(cls) -> "WhisperService":
         """Singleton pattern to ensure model is loaded only once."""
@@ -44,17 +56,63 @@ class WhisperService:
         if self._model is None:
             settings = get_settings()
             self.model_name = settings.whisper_model
-            logger.info(f"Loading Whisper model: {self.model_name}")
+            device, compute_type = self._resolve_device(
+                settings.whisper_device, settings.whisper_compute_type
+            )
+            
+            # Each worker gets its own share of the cores, so parallel
+            # transcriptions don't oversubscribe the CPU
+            cpu_threads = settings.whisper_cpu_threads or max(
+                1, (os.cpu_count() or 1) // settings.whisper_num_workers
+            )
+            
+            logger.info(
+                f"Loading Whisper model: {self.model_name} "
+                f"({device}, {compute_type}, {settings.whisper_num_workers} workers "
+                f"x {cpu_threads} threads)"
+            )
             
-            # Use CPU for Docker compatibility, auto for GPU if available
+            # CPU/int8 by default for Docker compatibility; set WHISPER_DEVICE
+            # to cuda or auto to run on a GPU.
+            # num_workers: uploads call transcribe from separate threads, and
+            # CTranslate2 runs up to this many of them in parallel (sharing
+            # the weights) instead of queueing them behind one another.
             self._model = WhisperModel(
                 self.model_name,
-                device="cpu",
-                compute_type="int8",
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                num_workers=settings.whisper_num_workers,
+                download_root=settings.whisper_download_root,
             )
             
+            # The batched pipeline splits the audio into speech chunks (VAD)
+            # and decodes batch_size of them per forward pass, instead of
+            # one 30s window at a time. It shares the loaded model.
+            self.beam_size = settings.whisper_beam_size
+            self.batch_size = settings.whisper_batch_size
+            if self.batch_size > 1:
+                self._pipeline = BatchedInferencePipeline(model=self._model)
+            
             logger.info(f"Whisper model '{self.model_name}' loaded successfully")
     
+    @staticmethod
+    def _resolve_device(device: str, compute_type: str) -> tuple[str, str]:
+        """
+        Pick the concrete device and compute type.
+        
+        "auto" becomes cuda when CTranslate2 sees a GPU. On a GPU, plain
+        int8 (the CPU default) is upgraded to int8_float16: same int8
+        weights, but float16 activations run on the tensor cores.
+        """
+        if device == "auto":
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        
+        if device == "cuda" and compute_type == "int8":
+            compute_type = "int8_float16"
+        
+        return device, compute_type
+    
     @property
     def model(self) -> WhisperModel:
         """Get the loaded Whisper model."""
@@ -89,12 +147,11 @@ class WhisperService:
         
         logger.info(f"Transcribing audio file: {audio_path}")
         
-        # Transcribe with faster-whisper
-        segments, info = self.model.transcribe(
-            str(audio_path),
-            language=language,
-            beam_size=5,
-        )
+        return self._run(str(audio_path), language)
+    
+    def _run(self, audio: str | BinaryIO | np.ndarray, language: Optional[str]) -> dict:
+        """Run faster-whisper on a file path or file-like object (see transcribe())."""
+        segments, info = self._start(audio, language)
         
         # Convert segments to list (it's a generator)
         segment_list = list(segments)
@@ -115,6 +172,49 @@ class WhisperService:
             "duration": info.duration,
         }
     
+    def _start(self, audio: str | BinaryIO | np.ndarray, language: Optional[str]):
+        """
+        Decode the audio and start transcription.
+        
+        Returns faster-whisper's (segments, info): info (language,
+        duration) is ready immediately, while segments is a lazy generator
+        that decodes the next stretch of audio each time it is advanced.
+        """
+        # Decode once up front so the clip length can pick the path below;
+        # both paths accept the decoded samples
+        if not isinstance(audio, np.ndarray):
+            audio = decode_audio(audio, sampling_rate=SAMPLE_RATE)
+        
+        # Transcribe with faster-whisper
+        if self._pipeline is not None and len(audio) >= _MIN_BATCHED_SECONDS * SAMPLE_RATE:
+            segments, info = self._pipeline.transcribe(
+                audio,
+                language=language,
+                beam_size=self.beam_size,
+                batch_size=self.batch_size,
+            )
+        else:
+            # vad_filter skips silent stretches (common in meeting audio)
+            # instead of decoding them; the batched pipeline always does this
+            segments, info = self.model.transcribe(
+                audio,
+                language=language,
+                beam_size=self.beam_size,
+                vad_filter=True,
+            )
+        
+        return segments, info
+    
+    def warm_up(self) -> None:
+        """
+        Run the model once on a second of silence.
+        
+        The first transcription also loads the VAD model and allocates
+        the CTranslate2 buffers; doing it at startup keeps that out of
+        the first real request.
+        """
+        self._run(np.zeros(SAMPLE_RATE, dtype=np.float32), language="en")
+    
     def transcribe_to_segments(
         self,
         audio_path: str | Path,
@@ -130,51 +230,91 @@ class WhisperService:
         Returns:
             Tuple of (segments, detected_language, duration_seconds)
         """
-        result = self.transcribe(audio_path, language)
-        
-        segments = []
-        for seg in result.get("segments", []):
-            segments.append(
-                TranscriptSegment(
-                    speaker="Speaker",  # Whisper doesn't do speaker diarization
-                    timestamp=self._format_timestamp(seg.start),
-                    text=seg.text.strip(),
-                    start_seconds=seg.start,
-                    end_seconds=seg.end,
-                )
-            )
+        return self._to_segments(self.transcribe(audio_path, language))
+    
+    def transcribe_stream(
+        self,
+        audio_file: BinaryIO,
+        language: Optional[str] = None,
+    ) -> tuple[list[TranscriptSegment], str, float]:
+        """
+        Transcribe audio from an open binary file object.
         
+        faster-whisper decodes straight from the file object, so an upload
+        can be transcribed without first reading it into memory or copying
+        it to a temp file.
+        
+        Args:
+            audio_file: Readable binary file (e.g. UploadFile.file)
+            language: Optional language code
+        
+        Returns:
+            Tuple of (segments, detected_language, duration_seconds)
+        """
+        logger.info("Transcribing uploaded audio stream")
+        return self._to_segments(self._run(audio_file, language))
+    
+    def transcribe_iter(
+        self,
+        audio_file: BinaryIO,
+        language: Optional[str] = None,
+    ) -> tuple[Iterator[TranscriptSegment], str, float]:
+        """
+        Transcribe audio lazily, one segment at a time.
+        
+        The audio is decoded (and the language detected) before this
+        returns; each segment is then transcribed only when the iterator
+        is advanced, so callers can forward segments as they are produced
+        instead of waiting for the whole recording.
+        
+        Args:
+            audio_file: Readable binary file (e.g. UploadFile.file)
+            language: Optional language code
+        
+        Returns:
+            Tuple of (segment iterator, detected_language, duration_seconds)
+        """
+        logger.info("Transcribing uploaded audio stream (incremental)")
+        segments, info = self._start(audio_file, language)
+        return (self._to_segment(seg) for seg in segments), info.language, info.duration
+    
+    def _to_segments(self, result: dict) -> tuple[list[TranscriptSegment], str, float]:
+        """Convert a transcribe() result into TranscriptSegment objects."""
+        segments = [self._to_segment(seg) for seg in result.get("segments", [])]
         return segments, result.get("language", "en"), result.get("duration", 0.0)
     
+    def _to_segment(self, seg) -> TranscriptSegment:
+        """Convert one faster-whisper segment into a TranscriptSegment."""
+        # Every field comes straight from Whisper as a str/float, so the
+        # model is built without re-validating it (one per segment adds
+        # up for hour-long recordings)
+        return TranscriptSegment.model_construct(
+            speaker="Speaker",  # Whisper doesn't do speaker diarization
+            timestamp=self._format_timestamp(seg.start),
+            text=seg.text.strip(),
+            start_seconds=seg.start,
+            end_seconds=seg.end,
+        )
+    
     def transcribe_bytes(
         self,
         audio_bytes: bytes,
-        file_extension: str = ".wav",
         language: Optional[str] = None,
     ) -> tuple[list[TranscriptSegment], str, float]:
         """
         Transcribe audio from bytes.
         
+        The bytes are decoded from memory (PyAV detects the container
+        from its header), with no temp file written and read back.
+        
         Args:
-            audio_bytes: Raw audio data
-            file_extension: File extension for the temp file
+            audio_bytes: Raw audio data (any format PyAV can detect)
             language: Optional language code
         
         Returns:
             Tuple of (segments, detected_language, duration_seconds)
         """
-        # Write bytes to temporary file
-        with tempfile.NamedTemporaryFile(
-            suffix=file_extension, delete=False
-        ) as tmp_file:
-            tmp_file.write(audio_bytes)
-            tmp_path = tmp_file.name
-        
-        try:
-            return self.transcribe_to_segments(tmp_path, language)
-        finally:
-            # Clean up temp file
-            Path(tmp_path).unlink(missing_ok=True)
+        return self._to_segments(self._run(io.BytesIO(audio_bytes), language))
     
     @staticmethod
     def _format_timestamp(seconds: float) -> str:
@@ -188,6 +328,178 @@ class WhisperService:
         return f"{minutes:02d}:{secs:02d}"
 
 
+class StreamingTranscriber:
+    """
+    Incremental transcription of a live audio stream (LocalAgreement-2).
+    
+    Audio is appended as it arrives and the buffered audio is re-transcribed
+    every round. A word is only CONFIRMED once two consecutive rounds agree
+    on it (the common prefix of their hypotheses), so partial results never
+    flicker. Once confirmed, audio before the last confirmed word is dropped
+    from the buffer, keeping each round short. If rounds keep disagreeing
+    for longer than MAX_BUFFER_SECONDS, the older pending words are
+    confirmed anyway so the buffer stays bounded.
+    
+        round N:    "we should move the dead"
+        round N+1:  "we should move the deadline to"
+        confirmed:  "we should move the"          (common prefix)
+    
+    USAGE:
+    ------
+        transcriber = StreamingTranscriber(get_whisper_service())
+        transcriber.insert_audio(pcm_bytes)     # 16 kHz mono int16
+        words = transcriber.process()           # newly confirmed words
+        ...
+        words = transcriber.finish()            # flush at end of stream
+    
+    Each word is a (start_seconds, end_seconds, text) tuple, with times
+    relative to the start of the stream.
+    """
+    
+    # Keep at most this much audio; older audio is cut at a confirmed word,
+    # force-confirming pending words if rounds haven't agreed on any
+    MAX_BUFFER_SECONDS = 15.0
+    
+    # Text of recent confirmed words passed as the prompt for the next round
+    PROMPT_CHARS = 200
+    
+    def __init__(self, service: WhisperService, language: Optional[str] = None) -> None:
+        self.service = service
+        self.language = language
+        
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._audio_offset = 0.0       # Stream time of self._audio[0]
+        self._confirmed: list[tuple[float, float, str]] = []
+        self._confirmed_end = 0.0      # Stream time where confirmed words end
+        self._previous: list[tuple[float, float, str]] = []
+        self._leftover = b""           # Odd trailing byte of the last frame
+    
+    @property
+    def buffered_seconds(self) -> float:
+        """Seconds of audio currently buffered."""
+        return len(self._audio) / SAMPLE_RATE
+    
+    @property
+    def text(self) -> str:
+        """All confirmed text so far."""
+        return "".join(word for _, _, word in self._confirmed).strip()
+    
+    def insert_audio(self, pcm: bytes) -> None:
+        """
+        Append 16 kHz mono signed 16-bit little-endian PCM.
+        
+        Frames may split a sample: an odd trailing byte is kept and
+        prepended to the next frame.
+        """
+        pcm = self._leftover + pcm
+        usable = len(pcm) - len(pcm) % 2
+        self._leftover = pcm[usable:]
+        
+        samples = np.frombuffer(pcm, dtype="<i2", count=usable // 2).astype(np.float32) / 32768.0
+        self._audio = np.concatenate((self._audio, samples))
+    
+    def process(self) -> list[tuple[float, float, str]]:
+        """
+        Run one round over the buffered audio.
+        
+        Returns:
+            Words newly confirmed by this round (may be empty)
+        """
+        hypothesis = self._transcribe()
+        
+        # LocalAgreement-2: confirm the prefix both rounds agree on
+        agreed = 0
+        for new, old in zip(hypothesis, self._previous):
+            if new[2].strip().lower() != old[2].strip().lower():
+                break
+            agreed += 1
+        
+        confirmed = hypothesis[:agreed]
+        self._previous = hypothesis[agreed:]
+        self._commit(confirmed)
+        
+        if self.buffered_seconds > self.MAX_BUFFER_SECONDS:
+            confirmed += self._trim()
+        
+        return confirmed
+    
+    def finish(self) -> list[tuple[float, float, str]]:
+        """
+        Confirm whatever the last round produced (end of stream).
+        
+        Returns:
+            The remaining unconfirmed words
+        """
+        remaining = self._previous
+        self._previous = []
+        self._commit(remaining)
+        return remaining
+    
+    def _transcribe(self) -> list[tuple[float, float, str]]:
+        """Transcribe the buffer, returning unconfirmed words in stream time."""
+        if not len(self._audio):
+            return []
+        
+        segments, _ = self.service.model.transcribe(
+            self._audio,
+            language=self.language,
+            beam_size=self.service.beam_size,
+            word_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=self.text[-self.PROMPT_CHARS:] or None,
+        )
+        
+        words = []
+        for segment in segments:
+            for word in segment.words or ():
+                start = self._audio_offset + word.start
+                end = self._audio_offset + word.end
+                # Skip words already confirmed in an earlier round
+                if end > self._confirmed_end:
+                    words.append((start, end, word.word))
+        return words
+    
+    def _commit(self, words: list[tuple[float, float, str]]) -> None:
+        """Record confirmed words."""
+        if words:
+            self._confirmed.extend(words)
+            self._confirmed_end = words[-1][1]
+    
+    def _trim(self) -> list[tuple[float, float, str]]:
+        """
+        Drop buffered audio up to the last confirmed word.
+        
+        Returns:
+            Pending words force-confirmed to make room (usually empty)
+        """
+        buffer_end = self._audio_offset + self.buffered_seconds
+        forced = []
+        
+        if buffer_end - self._confirmed_end > self.MAX_BUFFER_SECONDS:
+            # Rounds keep disagreeing, so nothing before the limit can be
+            # cut: confirm the pending words in the older half instead
+            limit = buffer_end - self.MAX_BUFFER_SECONDS / 2
+            while self._previous and self._previous[0][1] <= limit:
+                forced.append(self._previous.pop(0))
+            self._commit(forced)
+        
+        cut_time = self._confirmed_end
+        if not self._previous:
+            # Nothing pending (e.g. a long silence): keep only a short tail
+            # in case a word is just starting
+            cut_time = max(cut_time, buffer_end - 1.0)
+        
+        # Never keep more than the limit, even if no word could be confirmed
+        cut_time = max(cut_time, buffer_end - self.MAX_BUFFER_SECONDS)
+        
+        cut = int((cut_time - self._audio_offset) * SAMPLE_RATE)
+        if cut > 0:
+            self._audio = self._audio[cut:]
+            self._audio_offset += cut / SAMPLE_RATE
+        
+        return forced
+
+
 def get_whisper_service() -> WhisperService:
     """
     Get the Whisper service instance.
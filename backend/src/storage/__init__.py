@@ -0,0 +1,8 @@
+"""Meeting storage module for AI Meeting Intelligence System."""
+
+from .meeting_store import MeetingStore, get_meeting_store
+
+__all__ = [
+    "MeetingStore",
+    "get_meeting_store",
+]
@@ -0,0 +1,265 @@
+"""
+Meeting Store - Bounded In-Memory Cache over SQLite
+
+This module stores Meeting records (transcript, segments, analysis).
+
+=============================================================================
+WHY NOT A PLAIN DICT?
+=============================================================================
+
+Meetings used to live in a module-level dict for the life of the process,
+including every raw transcript and segment list. A server running for weeks
+grew without bound and lost everything on restart.
+
+Now every meeting is written to SQLite (one row, Pydantic JSON as a
+zstd-compressed blob), and only the most recently used Meeting objects
+are kept in memory:
+
+    save(meeting) ──► SQLite row (source of truth)
+                 └──► hot LRU (at most meeting_cache_max_entries objects)
+    
+    get(id) ──► hot LRU hit? ──► return it
+                     │ no
+                     ▼
+               load row from SQLite, rebuild Meeting, add to hot LRU
+
+The listing view (title, participants, has_analysis) is tiny, so it is
+kept in memory for every meeting and rebuilt from SQLite at startup.
+
+Transcript prose compresses roughly 5x at zstd level 3 for well under a
+millisecond per meeting, which shrinks the database file and the page
+cache it occupies by the same factor. Rows written before compression
+was added are plain JSON and are still read as-is.
+
+NOTE: The vector store is still in-memory. After startup, main.py re-adds
+every stored meeting to it in the background (_restore_vector_index),
+taking the vectors from the embedding cache, so Q&A works again without
+re-uploading. This only happens when EMBEDDING_CACHE_PATH is set;
+without the cache every meeting would be re-embedded, so meetings are
+then only listed and viewable after a restart until they are re-uploaded.
+=============================================================================
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+
+import zstandard
+
+from ..config import get_settings
+from ..models import Meeting
+
+logger = logging.getLogger(__name__)
+
+
+# (title, participants, has_analysis) - what GET /meetings needs per meeting
+MeetingIndexEntry = tuple[str, list[str], bool]
+
+# Every zstd frame starts with this; stored JSON always starts with "{"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 3
+
+
+class MeetingStore:
+    """
+    Meeting storage with a bounded hot cache in front of SQLite.
+    
+    ATTRIBUTES:
+    -----------
+        path: SQLite database file (":memory:" for a throwaway store)
+        max_hot: Maximum number of Meeting objects kept in memory
+    
+    USAGE:
+    ------
+        store = get_meeting_store()
+        store.save(meeting)
+        meeting = store.get(meeting_id)
+    """
+    
+    def __init__(self, path: str, max_hot: int) -> None:
+        self.path = path
+        self.max_hot = max_hot
+        
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        
+        # Uploads save from worker threads, so the connection and the two
+        # in-memory maps are shared behind one lock (every operation below
+        # is a single short statement)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        
+        # WAL + synchronous=NORMAL: a save() commit appends to the log instead
+        # of rewriting pages and fsyncing twice, and reads never wait on it.
+        # A power loss can drop the last commits but never corrupts the file.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meetings ("
+            " id TEXT PRIMARY KEY,"
+            " title TEXT NOT NULL,"
+            " participants TEXT NOT NULL,"
+            " has_analysis INTEGER NOT NULL,"
+            " data BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        
+        # zstandard (de)compressors are reusable but not thread-safe, so
+        # they are only used with the lock held
+        self._compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+        self._decompressor = zstandard.ZstdDecompressor()
+        
+        self._hot: OrderedDict[str, Meeting] = OrderedDict()
+        self._index: dict[str, MeetingIndexEntry] = {
+            meeting_id: (title, json.loads(participants), bool(has_analysis))
+            for meeting_id, title, participants, has_analysis in self._conn.execute(
+                "SELECT id, title, participants, has_analysis FROM meetings"
+            )
+        }
+        
+        logger.info(f"Meeting store ready at {path} ({len(self._index)} meetings)")
+    
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self._index
+    
+    def __len__(self) -> int:
+        return len(self._index)
+    
+    def index(self) -> list[tuple[str, MeetingIndexEntry]]:
+        """
+        Snapshot (meeting_id, (title, participants, has_analysis)) for all meetings.
+        
+        A copy (of references only) is returned, so callers can iterate it
+        while uploads in other threads keep saving.
+        """
+        with self._lock:
+            return list(self._index.items())
+    
+    def save(self, meeting: Meeting) -> None:
+        """Insert or replace a meeting."""
+        data = meeting.model_dump_json().encode()
+        
+        with self._lock:
+            self._write(
+                meeting,
+                data,
+                "INSERT OR REPLACE INTO meetings (title, participants, has_analysis, data, id)"
+                " VALUES (?, ?, ?, ?, ?)",
+            )
+    
+    def update(self, meeting: Meeting) -> bool:
+        """
+        Replace a stored meeting, but only if it still exists.
+        
+        An analysis is saved long after its meeting was read; if the meeting
+        was deleted in the meantime, save() would bring it back without its
+        vector store chunks. Returns False (and writes nothing) in that case.
+        """
+        data = meeting.model_dump_json().encode()
+        
+        with self._lock:
+            if meeting.id not in self._index:
+                return False
+            
+            self._write(
+                meeting,
+                data,
+                "UPDATE meetings SET title = ?, participants = ?, has_analysis = ?, data = ?"
+                " WHERE id = ?",
+            )
+        return True
+    
+    def get(self, meeting_id: str) -> Optional[Meeting]:
+        """Return a meeting, loading it from SQLite if it isn't in memory."""
+        with self._lock:
+            meeting = self._hot.get(meeting_id)
+            if meeting is not None:
+                self._hot.move_to_end(meeting_id)
+                return meeting
+        
+        data = self.get_json(meeting_id)
+        if data is None:
+            return None
+        
+        meeting = Meeting.model_validate_json(data)
+        with self._lock:
+            self._remember(meeting)
+        return meeting
+    
+    def get_json(self, meeting_id: str) -> Optional[bytes]:
+        """
+        Return a meeting's stored JSON without building a Meeting object.
+        
+        The decompressed blob is exactly Meeting.model_dump_json(), so it
+        can be sent as an API response as-is.
+        """
+        if meeting_id not in self._index:
+            return None
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM meetings WHERE id = ?", (meeting_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            data = row[0]
+            if data[:4] == _ZSTD_MAGIC:
+                data = self._decompressor.decompress(data)
+        return data
+    
+    def delete(self, meeting_id: str) -> bool:
+        """Delete a meeting. Returns False if it didn't exist."""
+        with self._lock:
+            if self._index.pop(meeting_id, None) is None:
+                return False
+            
+            self._hot.pop(meeting_id, None)
+            self._conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
+            self._conn.commit()
+        return True
+    
+    def _write(self, meeting: Meeting, data: bytes, sql: str) -> None:
+        """Run an insert/update for a meeting and update the in-memory maps (lock held)."""
+        entry = (meeting.title, meeting.participants, meeting.summary is not None)
+        row = (
+            entry[0],
+            json.dumps(entry[1]),
+            entry[2],
+            self._compressor.compress(data),
+            meeting.id,
+        )
+        self._conn.execute(sql, row)
+        self._conn.commit()
+        
+        self._index[meeting.id] = entry
+        self._remember(meeting)
+    
+    def _remember(self, meeting: Meeting) -> None:
+        """Add a meeting to the hot cache, evicting the least recently used (lock held)."""
+        self._hot[meeting.id] = meeting
+        self._hot.move_to_end(meeting.id)
+        
+        while len(self._hot) > self.max_hot:
+            self._hot.popitem(last=False)
+
+
+@lru_cache()
+def get_meeting_store() -> MeetingStore:
+    """
+    Get the MeetingStore instance (singleton).
+    
+    Returns:
+        MeetingStore: Shared store configured from settings
+    """
+    settings = get_settings()
+    return MeetingStore(
+        path=settings.meeting_db_path,
+        max_hot=settings.meeting_cache_max_entries,
+    )
@@ -1,5 +1,19 @@
 """Utilities module for AI Meeting Intelligence System."""
 
-from .helpers import format_duration, truncate_text
+from .helpers import (
+    JsonArrayStreamParser,
+    format_duration,
+    split_tokens,
+    truncate_text,
+    truncate_tokens,
+    validate_items,
+)
 
-__all__ = ["format_duration", "truncate_text"]
+__all__ = [
+    "JsonArrayStreamParser",
+    "format_duration",
+    "split_tokens",
+    "truncate_text",
+    "truncate_tokens",
+    "validate_items",
+]
@@ -1,5 +1,18 @@
 """Utility functions for AI Meeting Intelligence System."""
 
+import json
+import logging
+from functools import lru_cache
+from typing import Any
+
+import tiktoken
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Rough characters per token, used when no tokenizer can be loaded
+_CHARS_PER_TOKEN = 4
+
 
 def format_duration(seconds: float) -> str:
     """
@@ -40,3 +53,231 @@ def truncate_text(text: str, max_length: int = 100) -> str:
     if len(text) <= max_length:
         return text
     return text[:max_length - 3] + "..."
+
+
+@lru_cache()
+def _get_encoding(model: str) -> tiktoken.Encoding | None:
+    """
+    Get (and cache) the tokenizer for a model, defaulting to cl100k_base.
+    
+    tiktoken downloads the BPE file on first use (the Docker image bakes it
+    into TIKTOKEN_CACHE_DIR). If that fails, e.g. without network access,
+    None is returned and cached: callers fall back to estimating tokens
+    from characters until the process restarts.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Tokenizer unavailable, estimating tokens from characters: {e}")
+        return None
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str = "gpt-3.5-turbo") -> str:
+    """
+    Truncate text to a maximum number of tokens for the given model.
+    
+    LLM context limits and prefill cost are counted in tokens, not
+    characters, so this keeps prompts within a predictable budget
+    regardless of how token-dense the text is.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum number of tokens to keep
+        model: Model whose tokenizer should be used
+    
+    Returns:
+        The text, cut at a token boundary if it was over budget
+    """
+    # Every token is at least one character, so short text can't be over
+    if len(text) <= max_tokens:
+        return text
+    
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return text[:max_tokens * _CHARS_PER_TOKEN]
+    
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def split_tokens(text: str, max_tokens: int, model: str = "gpt-3.5-turbo") -> list[str]:
+    """
+    Split text into consecutive chunks of at most max_tokens tokens.
+    
+    Chunks break at line boundaries so transcript lines stay whole; a
+    single line longer than the budget is split at token boundaries.
+    
+    Args:
+        text: Text to split
+        max_tokens: Maximum number of tokens per chunk
+        model: Model whose tokenizer should be used
+    
+    Returns:
+        List of chunks covering the whole text, in order
+    """
+    if len(text) <= max_tokens:
+        return [text]
+    
+    encoding = _get_encoding(model)
+    if encoding is None:
+        size = max_tokens * _CHARS_PER_TOKEN
+        return [text[start:start + size] for start in range(0, len(text), size)]
+    
+    chunks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+    
+    for line in text.splitlines():
+        tokens = encoding.encode(line)
+        
+        if len(tokens) > max_tokens:
+            # Oversized line: flush, then emit it in token-sized pieces
+            if current:
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+            for start in range(0, len(tokens), max_tokens):
+                chunks.append(encoding.decode(tokens[start:start + max_tokens]))
+            continue
+        
+        if current and current_tokens + len(tokens) + 1 > max_tokens:
+            chunks.append("\n".join(current))
+            current, current_tokens = [], 0
+        
+        current.append(line)
+        current_tokens += len(tokens) + 1  # +1 for the newline
+    
+    if current:
+        chunks.append("\n".join(current))
+    
+    return chunks
+
+
+@lru_cache()
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Get (and cache) a TypeAdapter validating a list of the model."""
+    return TypeAdapter(list[model])
+
+
+def validate_items[ModelT: BaseModel](
+    model: type[ModelT], items: list[dict[str, Any]]
+) -> list[ModelT]:
+    """
+    Validate raw dicts (e.g. parsed from LLM output) into model instances.
+    
+    The whole list is validated in one call to pydantic-core instead of
+    one Python-level model __init__ per item. If any item is malformed,
+    falls back to validating items one by one and skips the bad ones.
+    
+    Args:
+        model: Pydantic model to validate into
+        items: Dicts to validate
+    
+    Returns:
+        List of valid model instances, in input order
+    """
+    try:
+        return _list_adapter(model).validate_python(items)
+    except ValidationError:
+        pass
+    
+    valid = []
+    for item in items:
+        try:
+            valid.append(model.model_validate(item))
+        except ValidationError as e:
+            logger.warning(f"Skipping malformed {model.__name__}: {e}")
+    
+    return valid
+
+
+class JsonArrayStreamParser:
+    """
+    Incrementally parse objects out of a JSON array arriving in chunks.
+    
+    Used with streamed LLM responses: each completed top-level object in the
+    first JSON array is returned as soon as its closing brace arrives, so
+    callers can start using items (or stop the stream) before the LLM
+    finishes generating. Text before the array and non-object elements
+    are ignored.
+    
+    USAGE:
+    ------
+        parser = JsonArrayStreamParser()
+        async for chunk in stream:
+            for item in parser.feed(chunk):
+                ...
+            if parser.done:
+                break
+    """
+    
+    def __init__(self) -> None:
+        self.done = False
+        self._buffer: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+    
+    def feed(self, chunk: str) -> list[dict[str, Any]]:
+        """
+        Consume the next chunk of text.
+        
+        Args:
+            chunk: Next piece of the streamed response
+        
+        Returns:
+            Objects completed by this chunk (may be empty)
+        """
+        items: list[dict[str, Any]] = []
+        
+        for char in chunk:
+            if self.done:
+                break
+            
+            if self._depth == 0:
+                # Outside the array: wait for the opening bracket
+                if char == "[":
+                    self._depth = 1
+                continue
+            
+            # Inside an element: collect its characters
+            if self._depth >= 2:
+                self._buffer.append(char)
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                if self._depth == 1:
+                    self._buffer = [char]
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+                if self._depth == 1:
+                    item = self._decode(self._buffer)
+                    if item is not None:
+                        items.append(item)
+                    self._buffer = []
+                elif self._depth == 0:
+                    self.done = True
+        
+        return items
+    
+    @staticmethod
+    def _decode(chars: list[str]) -> dict[str, Any] | None:
+        """Decode one buffered element, returning None unless it's a JSON object."""
+        try:
+            value = json.loads("".join(chars))
+        except json.JSONDecodeError:
+            return None
+        return value if isinstance(value, dict) else None
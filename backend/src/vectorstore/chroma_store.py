@@ -131,7 +131,7 @@ class ChromaStore:
         # Skip if already initialized
         if self._vector_store is not None:
             return
-            
+        
         settings = get_settings()
         
         logger.info("Initializing ChromaDB vector store (in-memory)")
@@ -181,6 +181,14 @@ class ChromaStore:
             separators=["\n\n", "\n", ". ", " ", ""],  # Try in this order
         )
         
+        # Bumped on every write so callers caching search results (e.g. the
+        # Q&A retrieval cache) can tell when the store contents changed
+        self.version = 0
+        
+        # meeting_id -> ids of its chunks, so deleting a meeting doesn't
+        # need a metadata-filtered scan of the whole collection
+        self._chunk_ids: dict[str, list[str]] = {}
+        
         logger.info("ChromaDB vector store initialized successfully")
     
     @property
@@ -219,83 +227,105 @@ class ChromaStore:
            - Splits long text into overlapping chunks
            - Good for general context
         """
-        logger.info(f"Adding meeting to vector store: {meeting.id}")
+        return self._add_segments(
+            meeting.id,
+            meeting.title,
+            meeting.segments or [],
+            meeting.raw_transcript,
+        )
+    
+    def add_transcript(
+        self,
+        meeting_id: str,
+        title: str,
+        segments: list[TranscriptSegment],
+    ) -> int:
+        """
+        Add transcript segments to the vector store.
+        
+        Same as add_meeting() for a meeting without a raw transcript, but
+        doesn't build a Meeting object just to take it apart again.
+        """
+        return self._add_segments(meeting_id, title, segments, None)
+    
+    def _add_segments(
+        self,
+        meeting_id: str,
+        meeting_title: str,
+        segments: list[TranscriptSegment],
+        raw_transcript: Optional[str],
+    ) -> int:
+        """Embed and store one meeting's segments and transcript chunks."""
+        logger.info(f"Adding meeting to vector store: {meeting_id}")
         
-        documents = []
+        # Texts and metadata are built as two parallel lists and handed to
+        # add_texts() directly; add_documents() would just unpack Document
+        # objects back into these same lists
         
         # ---------------------------------------------------------------------
         # Create documents from segments
         # ---------------------------------------------------------------------
-        if meeting.segments:
-            for i, segment in enumerate(meeting.segments):
-                # Create LangChain Document with text and metadata
-                doc = Document(
-                    # The actual text content
-                    page_content=f"[{segment.timestamp}] {segment.speaker}: {segment.text}",
-                    # Metadata for filtering and attribution
-                    metadata={
-                        "meeting_id": meeting.id,
-                        "meeting_title": meeting.title,
-                        "speaker": segment.speaker,
-                        "timestamp": segment.timestamp,
-                        "segment_index": i,
-                        "source": "segment",
-                    },
-                )
-                documents.append(doc)
+        # The actual text content
+        texts: list[str] = [
+            f"[{segment.timestamp}] {segment.speaker}: {segment.text}"
+            for segment in segments
+        ]
+        # Metadata for filtering and attribution
+        metadatas: list[dict] = [
+            {
+                "meeting_id": meeting_id,
+                "meeting_title": meeting_title,
+                "speaker": segment.speaker,
+                "timestamp": segment.timestamp,
+                "segment_index": i,
+                "source": "segment",
+            }
+            for i, segment in enumerate(segments)
+        ]
         
         # ---------------------------------------------------------------------
         # Create documents from chunked raw transcript
         # ---------------------------------------------------------------------
-        if meeting.raw_transcript:
+        # Without a raw transcript, Meeting.transcript_text() is exactly the
+        # segment texts joined by newlines; reuse them instead of re-rendering
+        transcript = raw_transcript if raw_transcript is not None else "\n".join(texts)
+        if transcript:
             # Split into chunks
-            chunks = self._text_splitter.split_text(meeting.raw_transcript)
+            chunks = self._text_splitter.split_text(transcript)
             
-            for i, chunk in enumerate(chunks):
-                doc = Document(
-                    page_content=chunk,
-                    metadata={
-                        "meeting_id": meeting.id,
-                        "meeting_title": meeting.title,
-                        "chunk_index": i,
-                        "source": "raw_transcript",
-                    },
-                )
-                documents.append(doc)
-        
-        if not documents:
-            logger.warning(f"No documents to add for meeting: {meeting.id}")
+            texts.extend(chunks)
+            metadatas.extend(
+                {
+                    "meeting_id": meeting_id,
+                    "meeting_title": meeting_title,
+                    "chunk_index": i,
+                    "source": "raw_transcript",
+                }
+                for i in range(len(chunks))
+            )
+        
+        if not texts:
+            logger.warning(f"No documents to add for meeting: {meeting_id}")
             return 0
         
         # ---------------------------------------------------------------------
         # Add to vector store
         # ---------------------------------------------------------------------
         # This is where the magic happens:
-        # 1. Each document's text is sent to OpenAI for embedding
+        # 1. All texts are embedded in batched OpenAI calls (not one per text)
         # 2. The embedding + document + metadata is stored in ChromaDB
-        self.vector_store.add_documents(documents)
-        
-        logger.info(f"Added {len(documents)} chunks for meeting: {meeting.id}")
-        return len(documents)
-    
-    def add_transcript(
-        self,
-        meeting_id: str,
-        title: str,
-        segments: list[TranscriptSegment],
-    ) -> int:
-        """
-        Add transcript segments to the vector store.
-        
-        Convenience method that creates a Meeting object and calls add_meeting.
-        """
-        meeting = Meeting(
-            id=meeting_id,
-            title=title,
-            segments=segments,
-            participants=list({seg.speaker for seg in segments}),
-        )
-        return self.add_meeting(meeting)
+        #
+        # Chunk ids are derived from the meeting id and remembered for
+        # delete_meeting(). Re-adding a meeting replaces its old chunks.
+        if meeting_id in self._chunk_ids:
+            self.delete_meeting(meeting_id)
+        ids = [f"{meeting_id}:{i}" for i in range(len(texts))]
+        self.vector_store.add_texts(texts, metadatas=metadatas, ids=ids)
+        self._chunk_ids[meeting_id] = ids
+        self.version += 1
+        
+        logger.info(f"Added {len(texts)} chunks for meeting: {meeting_id}")
+        return len(texts)
     
     def search(
         self,
@@ -395,12 +425,16 @@ class ChromaStore:
         """
         logger.info(f"Deleting meeting from vector store: {meeting_id}")
         
-        # Get all document IDs for this meeting
-        results = self.vector_store.get(where={"meeting_id": meeting_id})
+        # Chunk ids recorded by add_meeting(); anything added another way
+        # is found with a metadata query (ids only, no documents/vectors)
+        ids = self._chunk_ids.pop(meeting_id, None)
+        if ids is None:
+            ids = self.vector_store.get(where={"meeting_id": meeting_id}, include=[])["ids"]
         
-        if results and results.get("ids"):
-            self.vector_store.delete(ids=results["ids"])
-            logger.info(f"Deleted {len(results['ids'])} chunks for meeting: {meeting_id}")
+        if ids:
+            self.vector_store.delete(ids=ids)
+            self.version += 1
+            logger.info(f"Deleted {len(ids)} chunks for meeting: {meeting_id}")
         else:
             logger.warning(f"No documents found for meeting: {meeting_id}")
     
@@ -412,6 +446,7 @@ class ChromaStore:
         """
         logger.warning("Clearing all documents from vector store")
         self._client.reset()
+        self._chunk_ids.clear()
         
         # Reinitialize the collection
         settings = get_settings()
@@ -421,6 +456,7 @@ class ChromaStore:
             collection_name=settings.chroma_collection_name,
             embedding_function=embedding_service.embeddings,
         )
+        self.version += 1
 
 
 def get_chroma_store() -> ChromaStore:
@@ -432,4 +468,7 @@ def get_chroma_store() -> ChromaStore:
     Returns:
         ChromaStore: Singleton instance of the ChromaDB store
     """
-    return ChromaStore()
+    # Called on every search; once the store exists, return it without
+    # going through __new__/__init__ again
+    store = ChromaStore._instance
+    return store if store is not None else ChromaStore()
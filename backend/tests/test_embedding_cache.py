@@ -0,0 +1,110 @@
+"""Tests for CachedEmbeddings (the SQLite-backed document embedding cache)."""
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from src.services.embedding_service import CachedEmbeddings
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic embeddings that record what they were asked to embed."""
+    
+    def __init__(self) -> None:
+        self.document_calls: list[list[str]] = []
+        self.query_calls: list[str] = []
+    
+    @staticmethod
+    def _vector(text: str) -> list[float]:
+        # Values exactly representable as float32, like the stored vectors
+        return [float(len(text)), 0.5, -1.0]
+    
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.document_calls.append(list(texts))
+        return [self._vector(text) for text in texts]
+    
+    def embed_query(self, text: str) -> list[float]:
+        self.query_calls.append(text)
+        return self._vector(text)
+
+
+@pytest.fixture
+def fake():
+    return FakeEmbeddings()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "embeddings.db")
+
+
+def test_documents_miss_then_hit(fake, cache_path):
+    cached = CachedEmbeddings(fake, cache_path, namespace="model-a")
+    
+    first = cached.embed_documents(["hello", "world!"])
+    second = cached.embed_documents(["world!", "hello"])
+    
+    assert first == [[5.0, 0.5, -1.0], [6.0, 0.5, -1.0]]
+    assert second == [first[1], first[0]]
+    assert fake.document_calls == [["hello", "world!"]]
+
+
+def test_only_misses_are_embedded(fake, cache_path):
+    cached = CachedEmbeddings(fake, cache_path, namespace="model-a")
+    cached.embed_documents(["hello"])
+    
+    result = cached.embed_documents(["hello", "new text"])
+    
+    assert result == [[5.0, 0.5, -1.0], [8.0, 0.5, -1.0]]
+    assert fake.document_calls == [["hello"], ["new text"]]
+
+
+def test_duplicates_in_a_batch_are_embedded_once(fake, cache_path):
+    cached = CachedEmbeddings(fake, cache_path, namespace="model-a")
+    
+    result = cached.embed_documents(["same", "other", "same"])
+    
+    assert result[0] == result[2]
+    assert fake.document_calls == [["same", "other"]]
+
+
+def test_cache_survives_reopen(fake, cache_path):
+    CachedEmbeddings(fake, cache_path, namespace="model-a").embed_documents(["hello"])
+    
+    reopened = FakeEmbeddings()
+    result = CachedEmbeddings(reopened, cache_path, namespace="model-a").embed_documents(["hello"])
+    
+    assert result == [[5.0, 0.5, -1.0]]
+    assert reopened.document_calls == []
+
+
+def test_namespaces_are_separate(fake, cache_path):
+    CachedEmbeddings(fake, cache_path, namespace="model-a").embed_documents(["hello"])
+    CachedEmbeddings(fake, cache_path, namespace="model-b").embed_documents(["hello"])
+    
+    assert fake.document_calls == [["hello"], ["hello"]]
+
+
+async def test_async_documents_use_the_same_cache(fake, cache_path):
+    cached = CachedEmbeddings(fake, cache_path, namespace="model-a")
+    cached.embed_documents(["hello"])
+    
+    result = await cached.aembed_documents(["hello", "async"])
+    
+    assert result == [[5.0, 0.5, -1.0], [5.0, 0.5, -1.0]]
+    assert fake.document_calls == [["hello"], ["async"]]
+
+
+def test_queries_use_the_in_memory_lru(fake, cache_path, monkeypatch):
+    monkeypatch.setattr(CachedEmbeddings, "_QUERY_CACHE_SIZE", 2)
+    cached = CachedEmbeddings(fake, cache_path, namespace="model-a")
+    
+    cached.embed_query("a")
+    cached.embed_query("b")
+    cached.embed_query("a")  # hit, and now most recent
+    cached.embed_query("c")  # evicts "b"
+    cached.embed_query("a")  # hit
+    cached.embed_query("b")  # miss
+    
+    assert fake.query_calls == ["a", "b", "c", "b"]
+    # Queries are never written to the document cache
+    assert cached.embed_documents(["a"]) and fake.document_calls == [["a"]]
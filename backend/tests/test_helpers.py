@@ -0,0 +1,84 @@
+"""Tests for the shared helpers in src.utils."""
+
+import pytest
+from pydantic import BaseModel
+
+from src.utils import JsonArrayStreamParser, validate_items
+
+RESPONSE = (
+    '{"decisions": ['
+    '{"decision": "Ship [v2] on Friday", "made_by": "Alice"}, '
+    '{"decision": "Quote \\"}\\" stays in the string", "made_by": null}'
+    "]}"
+)
+
+
+def feed_in_chunks(parser: JsonArrayStreamParser, text: str, size: int) -> list[dict]:
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start:start + size]))
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(RESPONSE)])
+def test_stream_parser_chunked(size):
+    parser = JsonArrayStreamParser()
+    
+    items = feed_in_chunks(parser, RESPONSE, size)
+    
+    assert items == [
+        {"decision": "Ship [v2] on Friday", "made_by": "Alice"},
+        {"decision": 'Quote "}" stays in the string', "made_by": None},
+    ]
+    assert parser.done
+
+
+def test_stream_parser_returns_items_as_they_complete():
+    parser = JsonArrayStreamParser()
+    
+    assert parser.feed('{"items": [{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(': 2}') == [{"b": 2}]
+    assert not parser.done
+    assert parser.feed("]}") == []
+    assert parser.done
+
+
+def test_stream_parser_skips_malformed_and_non_object_elements():
+    parser = JsonArrayStreamParser()
+    
+    items = parser.feed('[{"a": 1}, {"b": }, 3, "x", [4], {"c": 3}]')
+    
+    assert items == [{"a": 1}, {"c": 3}]
+
+
+def test_stream_parser_stops_after_first_array():
+    parser = JsonArrayStreamParser()
+    
+    assert parser.feed('[{"a": 1}] [{"b": 2}]') == [{"a": 1}]
+    assert parser.done
+    assert parser.feed('[{"c": 3}]') == []
+
+
+def test_stream_parser_incomplete_input():
+    parser = JsonArrayStreamParser()
+    
+    assert feed_in_chunks(parser, '{"items": [{"a": 1}, {"b": 2', 4) == [{"a": 1}]
+    assert not parser.done
+
+
+class Item(BaseModel):
+    name: str
+    count: int = 0
+
+
+def test_validate_items_valid():
+    assert validate_items(Item, [{"name": "a"}, {"name": "b", "count": 2}]) == [
+        Item(name="a"),
+        Item(name="b", count=2),
+    ]
+
+
+def test_validate_items_skips_malformed():
+    items = [{"name": "a"}, {"count": 1}, {"name": "c", "count": "many"}, {"name": "d"}]
+    
+    assert validate_items(Item, items) == [Item(name="a"), Item(name="d")]
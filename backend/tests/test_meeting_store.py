@@ -0,0 +1,124 @@
+"""Tests for the SQLite-backed MeetingStore."""
+
+import sqlite3
+
+import pytest
+
+from src.models import Meeting, TranscriptSegment
+from src.storage.meeting_store import _ZSTD_MAGIC, MeetingStore
+
+
+def make_meeting(meeting_id: str = "m1", **fields) -> Meeting:
+    return Meeting(
+        id=meeting_id,
+        title=fields.pop("title", "Sprint Planning"),
+        raw_transcript="[00:00] Alice: Welcome everyone\n[00:05] Bob: Thanks",
+        segments=[
+            TranscriptSegment(speaker="Alice", timestamp="00:00", text="Welcome everyone"),
+            TranscriptSegment(speaker="Bob", timestamp="00:05", text="Thanks"),
+        ],
+        participants=["Alice", "Bob"],
+        **fields,
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "meetings.db")
+
+
+def test_round_trip(db_path):
+    store = MeetingStore(db_path, max_hot=4)
+    meeting = make_meeting()
+    store.save(meeting)
+    
+    assert "m1" in store
+    assert len(store) == 1
+    assert store.get("m1") == meeting
+    assert store.get_json("m1") == meeting.model_dump_json().encode()
+    assert store.index() == [("m1", ("Sprint Planning", ["Alice", "Bob"], False))]
+
+
+def test_rows_are_compressed(db_path):
+    store = MeetingStore(db_path, max_hot=4)
+    store.save(make_meeting())
+    
+    (data,) = sqlite3.connect(db_path).execute("SELECT data FROM meetings").fetchone()
+    assert data[:4] == _ZSTD_MAGIC
+
+
+def test_reopen_loads_from_sqlite(db_path):
+    meeting = make_meeting(summary="Planned the sprint")
+    MeetingStore(db_path, max_hot=4).save(meeting)
+    
+    reopened = MeetingStore(db_path, max_hot=4)
+    assert reopened.index() == [("m1", ("Sprint Planning", ["Alice", "Bob"], True))]
+    assert reopened.get("m1") == meeting
+
+
+def test_reads_uncompressed_rows(db_path):
+    store = MeetingStore(db_path, max_hot=4)
+    meeting = make_meeting()
+    store.save(meeting)
+    
+    # Rows written before compression hold plain JSON
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE meetings SET data = ?", (meeting.model_dump_json().encode(),))
+    conn.commit()
+    
+    assert MeetingStore(db_path, max_hot=4).get("m1") == meeting
+
+
+def test_hot_cache_is_bounded(db_path):
+    store = MeetingStore(db_path, max_hot=2)
+    for i in range(3):
+        store.save(make_meeting(f"m{i}"))
+    
+    assert list(store._hot) == ["m1", "m2"]
+    # Evicted meetings are still served from SQLite
+    assert store.get("m0").id == "m0"
+    assert list(store._hot) == ["m2", "m0"]
+
+
+def test_save_replaces(db_path):
+    store = MeetingStore(db_path, max_hot=4)
+    store.save(make_meeting())
+    store.save(make_meeting(title="Renamed", summary="Done"))
+    
+    assert len(store) == 1
+    assert store.index() == [("m1", ("Renamed", ["Alice", "Bob"], True))]
+    assert MeetingStore(db_path, max_hot=4).get("m1").title == "Renamed"
+
+
+def test_delete(db_path):
+    store = MeetingStore(db_path, max_hot=4)
+    store.save(make_meeting())
+    
+    assert store.delete("m1") is True
+    assert "m1" not in store
+    assert store.get("m1") is None
+    assert store.get_json("m1") is None
+    assert store.delete("m1") is False
+    assert len(MeetingStore(db_path, max_hot=4)) == 0
+
+
+def test_update_existing(db_path):
+    store = MeetingStore(db_path, max_hot=4)
+    store.save(make_meeting())
+    
+    assert store.update(make_meeting(summary="Planned the sprint")) is True
+    assert store.index() == [("m1", ("Sprint Planning", ["Alice", "Bob"], True))]
+    assert MeetingStore(db_path, max_hot=4).get("m1").summary == "Planned the sprint"
+
+
+def test_update_does_not_recreate_deleted_meeting(db_path):
+    store = MeetingStore(db_path, max_hot=4)
+    meeting = make_meeting()
+    store.save(meeting)
+    store.delete("m1")
+    
+    meeting.summary = "Finished after the delete"
+    assert store.update(meeting) is False
+    assert "m1" not in store
+    assert store.get("m1") is None
+    assert len(MeetingStore(db_path, max_hot=4)) == 0
@@ -0,0 +1,21 @@
+"""Tests for the agent state reducers."""
+
+import pytest
+
+from src.agents.state import merge_errors
+
+
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    [
+        (None, None, None),
+        (None, "b failed", "b failed"),
+        ("", "b failed", "b failed"),
+        ("a failed", None, "a failed"),
+        ("a failed", "", "a failed"),
+        ("a failed", "a failed", "a failed"),
+        ("a failed", "b failed", "a failed; b failed"),
+    ],
+)
+def test_merge_errors(left, right, expected):
+    assert merge_errors(left, right) == expected
@@ -0,0 +1,78 @@
+"""Tests for StreamingTranscriber (live transcription with LocalAgreement-2)."""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.services.whisper_service import SAMPLE_RATE, StreamingTranscriber
+
+
+class FakeModel:
+    """Returns a scripted list of (start, end, text) words per round."""
+    
+    def __init__(self, rounds) -> None:
+        self.rounds = iter(rounds)
+        self.buffer_seconds: list[float] = []
+    
+    def transcribe(self, audio, **kwargs):
+        self.buffer_seconds.append(len(audio) / SAMPLE_RATE)
+        words = [
+            SimpleNamespace(start=start, end=end, word=text)
+            for start, end, text in next(self.rounds)
+        ]
+        return [SimpleNamespace(words=words)], None
+
+
+def make_transcriber(rounds) -> StreamingTranscriber:
+    service = SimpleNamespace(model=FakeModel(rounds), beam_size=1)
+    return StreamingTranscriber(service)
+
+
+def pcm(seconds: float) -> bytes:
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype="<i2").tobytes()
+
+
+def test_odd_length_frames_are_joined():
+    transcriber = make_transcriber([])
+    samples = np.array([1, -2, 300, -32768], dtype="<i2").tobytes()
+    
+    transcriber.insert_audio(samples[:3])
+    transcriber.insert_audio(samples[3:7])
+    transcriber.insert_audio(samples[7:])
+    
+    np.testing.assert_array_equal(
+        transcriber._audio * 32768.0, np.array([1, -2, 300, -32768], dtype=np.float32)
+    )
+
+
+def test_agreed_prefix_is_confirmed():
+    transcriber = make_transcriber([
+        [(0.0, 0.5, " we"), (0.5, 1.0, " should")],
+        [(0.0, 0.5, " we"), (0.5, 1.0, " should"), (1.0, 1.5, " move")],
+    ])
+    transcriber.insert_audio(pcm(1.0))
+    
+    assert transcriber.process() == []
+    assert transcriber.process() == [(0.0, 0.5, " we"), (0.5, 1.0, " should")]
+    assert transcriber.finish() == [(1.0, 1.5, " move")]
+    assert transcriber.text == "we should move"
+
+
+def test_buffer_stays_bounded_when_rounds_disagree():
+    limit = StreamingTranscriber.MAX_BUFFER_SECONDS
+    # Every round hears a different word at the start, so nothing is agreed
+    rounds = [
+        [(0.0, 1.0, f" take{i}"), (1.0, 2.0, " the"), (limit, limit + 1.0, " end")]
+        for i in range(10)
+    ]
+    transcriber = make_transcriber(rounds)
+    
+    forced = []
+    for _ in range(10):
+        transcriber.insert_audio(pcm(4.0))
+        forced += transcriber.process()
+        assert transcriber.buffered_seconds <= limit
+    
+    assert transcriber.service.model.buffer_seconds[-1] <= limit + 4.0
+    # The oldest pending words were confirmed to make room
+    assert forced and forced == transcriber._confirmed
@@ -0,0 +1,69 @@
+"""Tests for the summarizer node and its key topic extraction."""
+
+import pytest
+
+from src.agents.cache import AnalysisCache
+from src.agents.nodes import summarizer
+from src.agents.nodes.summarizer import _extract_key_topics, summarizer_node
+
+
+@pytest.mark.parametrize(
+    "summary, expected",
+    [
+        (
+            "## Summary\nThe meeting went well.\n\n## Key Topics\n- Budget\n- Hiring\n",
+            ["Budget", "Hiring"],
+        ),
+        # Header phrase in ordinary prose before the real heading
+        (
+            "## Summary\nThe team reviewed the key topics for Q3...\n\n"
+            "## Key Topics\n- Budget\n- Hiring\n",
+            ["Budget", "Hiring"],
+        ),
+        # Section ends at the next heading
+        (
+            "## Topics Discussed\n* Budget\n• Hiring\n\n## Next Steps\n- Ship it\n",
+            ["Budget", "Hiring"],
+        ),
+        # Bold and plain headers, as some responses skip the markdown heading
+        ("**Key Topics:**\n- Budget\n", ["Budget"]),
+        ("Key topics:\n  - Budget\n  -  Hiring  \n", ["Budget", "Hiring"]),
+        # No bullets under the first match: keep looking
+        ("## Key Topics\nNone.\n\n### Key Topics Discussed\n- Budget\n", ["Budget"]),
+        ("## Summary\nNothing to see.\n", []),
+        ("## Key Topics", []),
+    ],
+)
+def test_extract_key_topics(summary, expected):
+    assert _extract_key_topics(summary) == expected
+
+
+class FakeLLMService:
+    def __init__(self) -> None:
+        self.calls = 0
+    
+    async def chat(self, messages) -> str:
+        self.calls += 1
+        return f"## Key Topics\n- Run {self.calls}\n"
+
+
+async def test_force_skips_the_summary_cache(monkeypatch):
+    llm = FakeLLMService()
+    monkeypatch.setattr(summarizer, "get_llm_service", lambda: llm)
+    cache = AnalysisCache(max_entries=8, ttl_seconds=60)
+    monkeypatch.setattr(summarizer, "get_analysis_cache", lambda: cache)
+    state = {
+        "meeting_id": "m1",
+        "meeting_title": "Sprint Planning",
+        "raw_transcript": "[00:00] Alice: Hi",
+        "parsed_transcript": "[00:00] Alice: Hi",
+        "prompt_transcript": "[00:00] Alice: Hi",
+        "participants_str": "Alice",
+    }
+    
+    assert (await summarizer_node(state))["key_topics"] == ["Run 1"]
+    assert (await summarizer_node(state))["key_topics"] == ["Run 1"]
+    assert (await summarizer_node({**state, "force": True}))["key_topics"] == ["Run 2"]
+    # The forced result replaced the cached one
+    assert (await summarizer_node(state))["key_topics"] == ["Run 2"]
+    assert llm.calls == 2
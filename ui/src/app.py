@@ -4,8 +4,10 @@ Streamlit UI for AI Meeting Intelligence System
 This is the main entry point for the Streamlit application.
 """
 
+import json
 import os
 import sys
+import time
 
 import httpx
 import streamlit as st
@@ -22,6 +24,15 @@ st.set_page_config(
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8001")
 API_BASE = f"{BACKEND_URL}/api/v1"
 
+# Transcript lines shown per page in the Transcript tab
+TRANSCRIPT_PAGE_LINES = 200
+
+# The meeting list is refetched on a rerun once it is older than this
+MEETINGS_MAX_AGE_SECONDS = 30
+
+# Above this many meetings the sidebar offers a title filter
+MEETING_FILTER_THRESHOLD = 50
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -69,21 +80,42 @@ def init_session_state():
     """Initialize session state variables."""
     if "meetings" not in st.session_state:
         st.session_state.meetings = []
+    if "meetings_fetched_at" not in st.session_state:
+        st.session_state.meetings_fetched_at = None
     if "selected_meeting" not in st.session_state:
         st.session_state.selected_meeting = None
     if "analysis_result" not in st.session_state:
         st.session_state.analysis_result = None
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
+    if "transcript_page" not in st.session_state:
+        st.session_state.transcript_page = 1
+
+
+@st.cache_resource
+def get_client() -> httpx.Client:
+    """
+    Shared HTTP client for all backend calls.
+    
+    Created once per server process (not per call or rerun), so requests
+    reuse pooled keep-alive connections instead of reconnecting each time.
+    Timeouts are set per request below.
+    """
+    return httpx.Client(
+        base_url=API_BASE,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
 
 
 def fetch_meetings():
     """Fetch list of meetings from backend."""
+    # Set before the request so a failing backend isn't retried every rerun
+    st.session_state.meetings_fetched_at = time.monotonic()
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{API_BASE}/meetings")
-            if response.status_code == 200:
-                st.session_state.meetings = response.json()
+        response = get_client().get("/meetings", timeout=30.0)
+        if response.status_code == 200:
+            st.session_state.meetings = response.json()
     except Exception as e:
         st.error(f"Failed to fetch meetings: {e}")
 
@@ -91,42 +123,73 @@ def fetch_meetings():
 def upload_transcript(title: str, transcript: str):
     """Upload a transcript to the backend."""
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(
-                f"{API_BASE}/transcripts/upload",
-                json={"title": title, "transcript": transcript},
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                st.error(f"Upload failed: {response.text}")
-                return None
+        response = get_client().post(
+            "/transcripts/upload",
+            json={"title": title, "transcript": transcript},
+            timeout=60.0,
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            st.error(f"Upload failed: {response.text}")
+            return None
     except Exception as e:
         st.error(f"Upload failed: {e}")
         return None
 
 
-def upload_audio(file, title: str = None, language: str = None):
-    """Upload and transcribe an audio file."""
+def upload_audio(file, title: str = None, language: str = None, progress=None):
+    """
+    Upload and transcribe an audio file.
+    
+    Uses the streaming endpoint, so segments arrive while Whisper is still
+    working; each one is shown in `progress` (an st.empty() placeholder)
+    if given. Returns {"meeting_id", "segments"} once all are received.
+    """
     try:
-        with httpx.Client(timeout=300.0) as client:
-            files = {"file": (file.name, file.getvalue(), file.type)}
-            data = {}
-            if title:
-                data["title"] = title
-            if language:
-                data["language"] = language
-            
-            response = client.post(
-                f"{API_BASE}/audio/transcribe",
-                files=files,
-                data=data,
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
+        # UploadedFile is already in memory; passing the file object lets
+        # httpx send it in chunks instead of copying it into one bytes object
+        file.seek(0)
+        files = {"file": (file.name, file, file.type)}
+        data = {}
+        if title:
+            data["title"] = title
+        if language:
+            data["language"] = language
+        
+        segments = []
+        with get_client().stream(
+            "POST",
+            "/audio/transcribe/stream",
+            files=files,
+            data=data,
+            timeout=300.0,
+        ) as response:
+            if response.status_code != 200:
+                response.read()
                 st.error(f"Transcription failed: {response.text}")
                 return None
+            
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                
+                if event["type"] == "segment":
+                    segments.append(event)
+                    if progress is not None:
+                        progress.caption(
+                            f"{len(segments)} segments so far · "
+                            f"[{event['timestamp']}] {event['text'][:80]}"
+                        )
+                elif event["type"] == "done":
+                    return {"meeting_id": event["meeting_id"], "segments": segments}
+                elif event["type"] == "error":
+                    st.error(f"Transcription failed: {event['detail']}")
+                    return None
+        
+        st.error("Transcription failed: the response ended early")
+        return None
     except Exception as e:
         st.error(f"Transcription failed: {e}")
         return None
@@ -135,13 +198,12 @@ def upload_audio(file, title: str = None, language: str = None):
 def analyze_meeting(meeting_id: str):
     """Run analysis on a meeting."""
     try:
-        with httpx.Client(timeout=120.0) as client:
-            response = client.post(f"{API_BASE}/meetings/{meeting_id}/analyze")
-            if response.status_code == 200:
-                return response.json()
-            else:
-                st.error(f"Analysis failed: {response.text}")
-                return None
+        response = get_client().post(f"/meetings/{meeting_id}/analyze", timeout=120.0)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            st.error(f"Analysis failed: {response.text}")
+            return None
     except Exception as e:
         st.error(f"Analysis failed: {e}")
         return None
@@ -150,21 +212,57 @@ def analyze_meeting(meeting_id: str):
 def ask_question(meeting_id: str, question: str):
     """Ask a question about a meeting."""
     try:
-        with httpx.Client(timeout=60.0) as client:
-            response = client.post(
-                f"{API_BASE}/meetings/{meeting_id}/ask",
-                json={"meeting_id": meeting_id, "question": question},
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                st.error(f"Question failed: {response.text}")
-                return None
+        response = get_client().post(
+            f"/meetings/{meeting_id}/ask",
+            json={"meeting_id": meeting_id, "question": question},
+            timeout=60.0,
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            st.error(f"Question failed: {response.text}")
+            return None
     except Exception as e:
         st.error(f"Question failed: {e}")
         return None
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def load_transcript(meeting_id: str) -> list[str]:
+    """
+    Fetch a meeting's transcript, split into lines for paging.
+    
+    Cached so switching views or rerunning doesn't download the whole
+    meeting again. A meeting's transcript never changes after upload;
+    the cache is cleared when a meeting is deleted.
+    """
+    response = get_client().get(f"/meetings/{meeting_id}", timeout=30.0)
+    response.raise_for_status()
+    data = response.json()
+    
+    transcript = data.get("raw_transcript")
+    if transcript is None:
+        # Audio meetings only store segments
+        transcript = "\n".join(
+            f"[{seg['timestamp']}] {seg['speaker']}: {seg['text']}"
+            for seg in data.get("segments", [])
+        ) or "No transcript available"
+    return transcript.splitlines()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_analysis(meeting_id: str) -> dict:
+    """
+    Fetch the stored analysis of an already analyzed meeting.
+    
+    Only call this for meetings with has_analysis set: the analyze
+    endpoint then returns the stored result without running the LLMs.
+    """
+    response = get_client().post(f"/meetings/{meeting_id}/analyze", timeout=30.0)
+    response.raise_for_status()
+    return response.json()
+
+
 def render_sidebar():
     """Render the sidebar with meeting list and upload options."""
     with st.sidebar:
@@ -207,7 +305,9 @@ def render_sidebar():
                 if st.button("Transcribe Audio", type="primary", disabled=not audio_file):
                     with st.spinner("Transcribing... ⏳ This may take a while"):
                         lang = None if language == "Auto-detect" else language
-                        result = upload_audio(audio_file, title or None, lang)
+                        progress = st.empty()
+                        result = upload_audio(audio_file, title or None, lang, progress)
+                        progress.empty()
                         if result:
                             st.success(f"✅ Transcribed: {len(result['segments'])} segments")
                             fetch_meetings()
@@ -218,24 +318,31 @@ def render_sidebar():
         if st.button("🔄 Refresh", use_container_width=True):
             fetch_meetings()
         
-        for meeting in st.session_state.meetings:
-            is_selected = (
-                st.session_state.selected_meeting 
-                and st.session_state.selected_meeting.get("id") == meeting["id"]
-            )
-            
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                if st.button(
-                    f"{'📊' if meeting.get('has_analysis') else '📝'} {meeting['title'][:25]}...",
-                    key=f"meeting_{meeting['id']}",
-                    type="primary" if is_selected else "secondary",
-                    use_container_width=True,
-                ):
-                    st.session_state.selected_meeting = meeting
-                    st.session_state.analysis_result = None
-                    st.session_state.chat_history = []
-                    st.rerun()
+        meetings = st.session_state.meetings
+        
+        # Every listed meeting is a button re-sent on each run; long lists
+        # can be narrowed down instead of scrolling through all of them
+        if len(meetings) > MEETING_FILTER_THRESHOLD:
+            query = st.text_input("Filter", placeholder="Filter by title", key="meeting_filter")
+            if query:
+                query = query.lower()
+                meetings = [m for m in meetings if query in m["title"].lower()]
+        
+        selected = st.session_state.selected_meeting
+        selected_id = selected.get("id") if selected else None
+        
+        for meeting in meetings:
+            if st.button(
+                f"{'📊' if meeting.get('has_analysis') else '📝'} {meeting['title'][:25]}...",
+                key=f"meeting_{meeting['id']}",
+                type="primary" if meeting["id"] == selected_id else "secondary",
+                use_container_width=True,
+            ):
+                st.session_state.selected_meeting = meeting
+                st.session_state.analysis_result = None
+                st.session_state.chat_history = []
+                st.session_state.transcript_page = 1
+                st.rerun()
 
 
 def render_main_content():
@@ -291,33 +398,54 @@ def render_main_content():
     with col2:
         if st.button("🗑️ Delete Meeting", type="secondary", use_container_width=True):
             try:
-                with httpx.Client(timeout=30.0) as client:
-                    client.delete(f"{API_BASE}/meetings/{meeting['id']}")
+                response = get_client().delete(f"/meetings/{meeting['id']}", timeout=30.0)
+                if response.status_code not in (200, 404):  # 404: already gone
+                    response.raise_for_status()
+                load_transcript.clear()
+                load_analysis.clear()
+                
+                # Drop it from the list locally instead of refetching the
+                # whole list; the periodic refresh reconciles the rest
+                st.session_state.meetings = [
+                    m for m in st.session_state.meetings if m["id"] != meeting["id"]
+                ]
                 st.session_state.selected_meeting = None
                 st.session_state.analysis_result = None
-                fetch_meetings()
                 st.rerun()
             except Exception as e:
                 st.error(f"Failed to delete: {e}")
     
     st.divider()
     
-    # Tabs for different views
-    tab1, tab2, tab3 = st.tabs(["📊 Analysis", "💬 Q&A Chat", "📄 Transcript"])
+    # A radio instead of st.tabs: tabs run every tab's body on each run,
+    # while this only renders (and fetches data for) the selected view
+    view = st.radio(
+        "View",
+        ["📊 Analysis", "💬 Q&A Chat", "📄 Transcript"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="view",
+    )
     
-    with tab1:
+    if view == "📊 Analysis":
         render_analysis_tab()
-    
-    with tab2:
+    elif view == "💬 Q&A Chat":
         render_chat_tab()
-    
-    with tab3:
+    else:
         render_transcript_tab()
 
 
 def render_analysis_tab():
     """Render the analysis results tab."""
     result = st.session_state.analysis_result
+    meeting = st.session_state.selected_meeting
+    
+    # Show an existing analysis without waiting for "Analyze Meeting"
+    if not result and meeting.get("has_analysis"):
+        try:
+            result = st.session_state.analysis_result = load_analysis(meeting["id"])
+        except Exception as e:
+            st.error(f"Failed to load analysis: {e}")
     
     if not result:
         st.info("Click 'Analyze Meeting' to generate insights")
@@ -345,14 +473,13 @@ def render_analysis_tab():
         st.markdown("### ⚖️ Decisions")
         decisions = summary.get("decisions", [])
         if decisions:
-            for d in decisions:
-                with st.container():
-                    st.markdown(f"""
-                    <div class="card decision-card">
-                        <strong>{d.get('decision', 'Unknown decision')}</strong>
-                        <br><small>Made by: {d.get('made_by', 'Not specified')}</small>
-                    </div>
-                    """, unsafe_allow_html=True)
+            # All cards go out as one markdown element rather than one each
+            st.markdown("".join(f"""
+            <div class="card decision-card">
+                <strong>{d.get('decision', 'Unknown decision')}</strong>
+                <br><small>Made by: {d.get('made_by', 'Not specified')}</small>
+            </div>
+            """ for d in decisions), unsafe_allow_html=True)
         else:
             st.caption("No decisions extracted")
     
@@ -360,24 +487,32 @@ def render_analysis_tab():
         st.markdown("### ✅ Action Items")
         actions = summary.get("action_items", [])
         if actions:
-            for a in actions:
-                priority = a.get("priority", "medium")
-                priority_emoji = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(priority, "⚪")
-                
-                with st.container():
-                    st.markdown(f"""
-                    <div class="card action-card">
-                        {priority_emoji} <strong>{a.get('task', 'Unknown task')}</strong>
-                        <br><small>Owner: {a.get('owner', 'Unassigned')} | 
-                        Deadline: {a.get('deadline', 'Not set')}</small>
-                    </div>
-                    """, unsafe_allow_html=True)
+            priority_emojis = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+            st.markdown("".join(f"""
+            <div class="card action-card">
+                {priority_emojis.get(a.get('priority', 'medium'), '⚪')}
+                <strong>{a.get('task', 'Unknown task')}</strong>
+                <br><small>Owner: {a.get('owner', 'Unassigned')} | 
+                Deadline: {a.get('deadline', 'Not set')}</small>
+            </div>
+            """ for a in actions), unsafe_allow_html=True)
         else:
             st.caption("No action items extracted")
 
 
+def format_sources(sources: list[str]) -> str:
+    """Format an answer's sources as one numbered, truncated caption."""
+    return "\n\n".join(f"{i}. {source[:200]}..." for i, source in enumerate(sources, 1))
+
+
+@st.fragment
 def render_chat_tab():
-    """Render the Q&A chat tab."""
+    """
+    Render the Q&A chat tab.
+    
+    A fragment: asking a question reruns only this function, not the
+    sidebar and the rest of the page.
+    """
     meeting = st.session_state.selected_meeting
     
     st.markdown("### 💬 Ask Questions About the Meeting")
@@ -393,8 +528,7 @@ def render_chat_tab():
             st.chat_message("assistant").markdown(content)
             if msg.get("sources"):
                 with st.expander("📚 Sources"):
-                    for i, source in enumerate(msg["sources"], 1):
-                        st.caption(f"{i}. {source[:200]}...")
+                    st.caption(msg["sources"])
     
     # Chat input
     question = st.chat_input("Ask a question about this meeting...")
@@ -410,7 +544,8 @@ def render_chat_tab():
         
         if result:
             answer = result["answer"]
-            sources = result.get("sources", [])
+            # Formatted once here; history reruns just emit the string
+            sources = format_sources(result.get("sources", []))
             
             st.session_state.chat_history.append({
                 "role": "assistant",
@@ -421,31 +556,48 @@ def render_chat_tab():
             st.chat_message("assistant").markdown(answer)
             if sources:
                 with st.expander("📚 Sources"):
-                    for i, source in enumerate(sources, 1):
-                        st.caption(f"{i}. {source[:200]}...")
+                    st.caption(sources)
         
-        st.rerun()
+        # No st.rerun(): the new turn is already on screen and saved in
+        # chat_history for the next run
 
 
+@st.fragment
 def render_transcript_tab():
-    """Render the transcript view tab."""
+    """Render the transcript view tab (a fragment, so paging reruns only it)."""
     meeting = st.session_state.selected_meeting
     
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{API_BASE}/meetings/{meeting['id']}")
-            if response.status_code == 200:
-                data = response.json()
-                transcript = data.get("raw_transcript", "No transcript available")
-                
-                st.markdown("### 📄 Full Transcript")
-                st.text_area(
-                    "Transcript",
-                    transcript,
-                    height=500,
-                    disabled=True,
-                    label_visibility="collapsed",
-                )
+        lines = load_transcript(meeting["id"])
+        
+        st.markdown("### 📄 Full Transcript")
+        
+        # Only one page is sent to the browser per run, so long meetings
+        # don't ship their whole transcript on every interaction
+        pages = max(1, -(-len(lines) // TRANSCRIPT_PAGE_LINES))
+        page = 1
+        if pages > 1:
+            # Kept outside the widget, whose state is dropped while the
+            # Transcript view isn't shown
+            page = st.number_input(
+                "Page",
+                min_value=1,
+                max_value=pages,
+                value=min(st.session_state.transcript_page, pages),
+            )
+            st.session_state.transcript_page = page
+        start = (page - 1) * TRANSCRIPT_PAGE_LINES
+        end = min(start + TRANSCRIPT_PAGE_LINES, len(lines))
+        
+        st.text_area(
+            "Transcript",
+            "\n".join(lines[start:end]),
+            height=500,
+            disabled=True,
+            label_visibility="collapsed",
+        )
+        if pages > 1:
+            st.caption(f"Lines {start + 1}-{end} of {len(lines)}")
     except Exception as e:
         st.error(f"Failed to load transcript: {e}")
 
@@ -454,8 +606,11 @@ def main():
     """Main application entry point."""
     init_session_state()
     
-    # Initial fetch
-    if not st.session_state.meetings:
+    # Initial fetch, then only when stale; upload, delete and Refresh fetch
+    # on their own. Checking for an empty list instead would refetch on every
+    # rerun while there are no meetings.
+    fetched_at = st.session_state.meetings_fetched_at
+    if fetched_at is None or time.monotonic() - fetched_at > MEETINGS_MAX_AGE_SECONDS:
         fetch_meetings()
     
     render_sidebar()